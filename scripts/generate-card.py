@@ -4,21 +4,35 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
+import functools
 import json
-import math
+import operator
 import random
 import re
 import sys
+import zlib
 from datetime import date
+from math import isfinite
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 WIDTH = 1200
 HEIGHT = 1800
 
+CONTENT_RIGHT = WIDTH - 48
+CONTENT_W = WIDTH - 96
+ROW_RIGHT = WIDTH - 56
+MID_X = WIDTH // 2
+LEFT_COL_RIGHT = MID_X - 24
+RIGHT_COL_X = MID_X + 24
+
 BG = "#0b0d12"
 TEXT_BRIGHT = "#e8eaf0"
 TEXT_MED = "#8a8fa0"
@@ -26,6 +40,8 @@ TEXT_DIM = "#555a68"
 TEXT_VERY_DIM = "#3d4250"
 DIVIDER = "#1a1d26"
 WELL_BG = "#10131a"
+GRID_LINE = "#6366f1"
+GRID_STEP = 40
 
 CATEGORY_COLORS = {
     "COST": "#22c55e",
@@ -41,6 +57,26 @@ SOURCE_COLORS = {
     "self_initiated": "#a855f7",
 }
 
+VERDICT_STYLES = {
+    "helpful": ("#22c55e", "▲"),
+    "unnecessary": ("#f97316", "■"),
+    "partial": ("#3b82f6", "◆"),
+    "risky": ("#dc2626", "⚠"),
+}
+
+FONT_SPECS = {
+    "mono": ("JetBrainsMono-Regular.ttf", 20),
+    "mono_sm": ("JetBrainsMono-Regular.ttf", 16),
+    "mono_xs": ("JetBrainsMono-Regular.ttf", 14),
+    "heading": ("SpaceGrotesk-Bold.ttf", 28),
+    "heading_lg": ("SpaceGrotesk-Bold.ttf", 44),
+    "title": ("SpaceGrotesk-Bold.ttf", 58),
+    "body": ("SpaceGrotesk-Regular.ttf", 22),
+    "body_sm": ("SpaceGrotesk-Regular.ttf", 18),
+    "body_xs": ("SpaceGrotesk-Regular.ttf", 16),
+    "bold": ("SpaceGrotesk-Bold.ttf", 20),
+}
+
 RATING_SCALE = [
     ("Unpaid Intern", "#dc2626"),
     ("Quiet Quitter", "#f97316"),
@@ -50,6 +86,27 @@ RATING_SCALE = [
     ("AGI", "#a855f7"),
 ]
 
+_COND_TOKEN_RE = re.compile(
+    r"\s*(?:"
+    r"(?P<bool>(?<=\s)(?:AND|OR)(?=\s))"
+    r"|(?P<key>[a-zA-Z0-9_]+)\s*(?P<op>>=|<=|>|<|==|!=)\s*(?P<val>-?[0-9]+(?:\.[0-9]+)?)"
+    r"|(?P<junk>\S+)"
+    r")",
+    re.IGNORECASE,
+)
+_OPERATORS = {
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+_COLOR_RE = re.compile(r"#(?:[0-9a-fA-F]{6}|[0-9a-fA-F]{3})")
+_MONEY_RE = re.compile(r"\$([0-9]+(?:\.[0-9]+)?)")
+_MONEY_PLACEHOLDER_RE = re.compile(r"\$\{([a-zA-Z0-9_]+)\}")
+_PLACEHOLDER_RE = re.compile(r"\{[a-zA-Z0-9_]+\}")
+
 
 class CardGenerationError(Exception):
     """Raised when card generation cannot proceed safely."""
@@ -60,13 +117,18 @@ def warn(msg: str) -> None:
 
 
 def safe_float(value: object, default: float = 0.0) -> float:
+    kind = type(value)
+    if kind is float:
+        return value if isfinite(value) else default
+    if kind is int:
+        return float(value)
     try:
         if value is None:
             return default
         if isinstance(value, bool):
             return float(int(value))
         v = float(value)
-        if not math.isfinite(v):
+        if not isfinite(v):
             return default
         return v
     except (TypeError, ValueError):
@@ -74,6 +136,8 @@ def safe_float(value: object, default: float = 0.0) -> float:
 
 
 def safe_int(value: object, default: int = 0) -> int:
+    if type(value) is int:
+        return value
     try:
         if value is None:
             return default
@@ -89,11 +153,6 @@ def safe_text(value: object, default: str = "", max_len: int = 240) -> str:
         text = default
     elif isinstance(value, str):
         text = value
-    elif isinstance(value, (dict, list, tuple, set)):
-        try:
-            text = json.dumps(value, ensure_ascii=False, default=str)
-        except TypeError:
-            text = str(value)
     else:
         text = str(value)
     text = text.replace("\x00", " ").strip()
@@ -106,7 +165,7 @@ def safe_text(value: object, default: str = "", max_len: int = 240) -> str:
 
 def safe_color(value: object, default: str) -> str:
     text = safe_text(value, default=default, max_len=16)
-    if re.fullmatch(r"#(?:[0-9a-fA-F]{6}|[0-9a-fA-F]{3})", text):
+    if _COLOR_RE.fullmatch(text):
         return text
     return default
 
@@ -127,12 +186,71 @@ def as_list(value: object, label: str) -> List:
     return []
 
 
+class AnalysisView(NamedTuple):
+    tasks: Dict
+    cost: Dict
+    by_source: Dict
+    heartbeats: Dict
+    self_initiated: Dict
+    health: Dict
+    auto: Dict
+    skills: Dict
+    rating: Dict
+    notable: List
+    top_used: List
+    unused: List
+    asked: int
+    completed: int
+    completion_rate: float
+    error_rate: float
+    errors_self_caused: int
+    total_usd: float
+    heartbeat_usd: float
+    self_usd: float
+
+    @classmethod
+    def from_dict(cls, analysis: Dict) -> "AnalysisView":
+        tasks = as_dict(analysis.get("tasks"), "tasks")
+        cost = as_dict(analysis.get("cost"), "cost")
+        by_source = as_dict(cost.get("by_source"), "cost.by_source")
+        heartbeats = as_dict(by_source.get("heartbeats"), "cost.by_source.heartbeats")
+        self_initiated = as_dict(by_source.get("self_initiated"), "cost.by_source.self_initiated")
+        health = as_dict(analysis.get("health"), "health")
+        auto = as_dict(analysis.get("autonomous"), "autonomous")
+        skills = as_dict(analysis.get("skills"), "skills")
+        asked = max(safe_int(tasks.get("asked"), 0), 1)
+        error_rate = safe_float(health.get("error_rate"), 0.0)
+        if error_rate <= 0:
+            error_rate = safe_float(health.get("errors_total"), 0.0) / float(asked)
+        return cls(
+            tasks=tasks,
+            cost=cost,
+            by_source=by_source,
+            heartbeats=heartbeats,
+            self_initiated=self_initiated,
+            health=health,
+            auto=auto,
+            skills=skills,
+            rating=as_dict(analysis.get("rating"), "rating"),
+            notable=as_list(auto.get("notable"), "autonomous.notable"),
+            top_used=as_list(skills.get("top_used"), "skills.top_used"),
+            unused=as_list(skills.get("unused"), "skills.unused"),
+            asked=asked,
+            completed=safe_int(tasks.get("completed"), 0),
+            completion_rate=safe_float(tasks.get("completion_rate"), 0.0),
+            error_rate=error_rate,
+            errors_self_caused=safe_int(health.get("errors_self_caused"), 0),
+            total_usd=safe_float(cost.get("total_usd"), 0.0),
+            heartbeat_usd=safe_float(heartbeats.get("usd"), 0.0),
+            self_usd=safe_float(self_initiated.get("usd"), 0.0),
+        )
+
+
 def load_json(path: Path) -> Dict:
-    if not path.exists():
-        raise CardGenerationError(f"analysis file does not exist: {path}")
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json_loads(path.read_bytes())
+    except FileNotFoundError as exc:
+        raise CardGenerationError(f"analysis file does not exist: {path}") from exc
     except json.JSONDecodeError as exc:
         raise CardGenerationError(f"analysis file is not valid JSON: {path} ({exc})") from exc
     except OSError as exc:
@@ -186,9 +304,78 @@ def draw_rounded_box(
     draw.rounded_rectangle(xy, radius=radius, fill=fill, outline=outline, width=width)
 
 
+@functools.lru_cache(maxsize=512)
+def _text_mask(font: ImageFont.FreeTypeFont, text: str, anchor: str, mode: str) -> Tuple[Image.Image, int, int]:
+    left, top, right, bottom = font.getbbox(text, mode, anchor=anchor)
+    mask = Image.new("L", (right - left, bottom - top))
+    mask_draw = ImageDraw.Draw(mask)
+    mask_draw.fontmode = mode
+    mask_draw.text((-left, -top), text, fill=255, font=font, anchor=anchor)
+    return mask, left, top
+
+
+def cached_text(
+    draw: ImageDraw.ImageDraw,
+    xy: Tuple[int, int],
+    text: str,
+    fill: str,
+    font: ImageFont.FreeTypeFont,
+    anchor: Optional[str] = None,
+) -> None:
+    # Plain single-line text at integer positions reuses a rendered mask through
+    # ImageDraw.bitmap; anything else is left to draw.text.
+    x, y = xy
+    if not text or "\n" in text or not (isinstance(x, int) and isinstance(y, int)):
+        draw.text(xy, text, fill=fill, font=font, anchor=anchor)
+        return
+    mask, left, top = _text_mask(font, text, anchor or "la", draw.fontmode)
+    draw.bitmap((x + left, y + top), mask, fill=fill)
+
+
 def text_width(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFont) -> int:
-    bbox = draw.textbbox((0, 0), text, font=font)
-    return bbox[2] - bbox[0]
+    if "\n" in text:
+        bbox = draw.textbbox((0, 0), text, font=font)
+        return bbox[2] - bbox[0]
+    return _line_width(font, text)
+
+
+@functools.lru_cache(maxsize=1024)
+def _line_width(font: ImageFont.FreeTypeFont, text: str) -> int:
+    left, _, right, _ = font.getbbox(text)
+    return right - left
+
+
+@functools.lru_cache(maxsize=4096)
+def _advance(font: ImageFont.FreeTypeFont, text: str) -> int:
+    return font.getbbox(text)[2]
+
+
+@functools.lru_cache(maxsize=16)
+def mono_advance(font: ImageFont.FreeTypeFont) -> float:
+    return font.getlength("0")
+
+
+def break_lines(
+    widths: Sequence[int],
+    space: int,
+    max_width: int,
+    max_lines: Optional[int] = None,
+) -> List[Tuple[int, int]]:
+    spans: List[Tuple[int, int]] = []
+    start = 0
+    current_w = widths[0]
+    for i in range(1, len(widths)):
+        candidate_w = current_w + space + widths[i]
+        if candidate_w <= max_width:
+            current_w = candidate_w
+            continue
+        spans.append((start, i))
+        if max_lines and len(spans) >= max_lines:
+            return spans
+        start = i
+        current_w = widths[i]
+    spans.append((start, len(widths)))
+    return spans
 
 
 def wrap_lines(
@@ -202,61 +389,69 @@ def wrap_lines(
     if not words:
         return [""]
 
-    lines: List[str] = []
-    current = words[0]
-    for word in words[1:]:
-        candidate = f"{current} {word}"
-        if text_width(draw, candidate, font) <= max_width:
-            current = candidate
-        else:
-            lines.append(current)
-            current = word
-            if max_lines and len(lines) >= max_lines:
-                break
-
-    if not max_lines or len(lines) < max_lines:
-        lines.append(current)
-
-    if max_lines and len(lines) > max_lines:
-        lines = lines[:max_lines]
+    widths = [_advance(font, word) for word in words]
+    space = _advance(font, " ")
+    lines = [" ".join(words[start:end]) for start, end in break_lines(widths, space, max_width, max_lines)]
 
     if max_lines and len(lines) == max_lines:
-        while text_width(draw, lines[-1], font) > max_width and len(lines[-1]) > 2:
-            lines[-1] = lines[-1][:-2] + "…"
+        last = lines[-1]
+        if len(last) > 2 and text_width(draw, last, font) > max_width:
+            lo, hi = 1, len(last) - 2
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if text_width(draw, last[:mid] + "…", font) <= max_width:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            lines[-1] = last[:lo] + "…"
 
     return lines
 
 
 def safe_font(path: Path, size: int) -> ImageFont.FreeTypeFont:
+    return _load_font(str(path), size)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
     try:
-        return ImageFont.truetype(str(path), size=size)
+        return ImageFont.truetype(path, size=size)
     except OSError:
         warn(f"font missing/unreadable: {path}; using PIL default font fallback.")
         return ImageFont.load_default()
 
 
-def load_fonts(fonts_dir: Path) -> Dict[str, ImageFont.FreeTypeFont]:
-    return {
-        "mono": safe_font(fonts_dir / "JetBrainsMono-Regular.ttf", 20),
-        "mono_sm": safe_font(fonts_dir / "JetBrainsMono-Regular.ttf", 16),
-        "mono_xs": safe_font(fonts_dir / "JetBrainsMono-Regular.ttf", 14),
-        "heading": safe_font(fonts_dir / "SpaceGrotesk-Bold.ttf", 28),
-        "heading_lg": safe_font(fonts_dir / "SpaceGrotesk-Bold.ttf", 44),
-        "title": safe_font(fonts_dir / "SpaceGrotesk-Bold.ttf", 58),
-        "body": safe_font(fonts_dir / "SpaceGrotesk-Regular.ttf", 22),
-        "body_sm": safe_font(fonts_dir / "SpaceGrotesk-Regular.ttf", 18),
-        "body_xs": safe_font(fonts_dir / "SpaceGrotesk-Regular.ttf", 16),
-        "bold": safe_font(fonts_dir / "SpaceGrotesk-Bold.ttf", 20),
-    }
+class LazyFonts:
+    __slots__ = ("_dir", "_cache")
+
+    def __init__(self, fonts_dir: Path) -> None:
+        self._dir = fonts_dir
+        self._cache: Dict[str, ImageFont.FreeTypeFont] = {}
+
+    def __getitem__(self, name: str) -> ImageFont.FreeTypeFont:
+        font = self._cache.get(name)
+        if font is None:
+            filename, size = FONT_SPECS[name]
+            font = self._cache[name] = safe_font(self._dir / filename, size)
+        return font
+
+
+def load_fonts(fonts_dir: Path) -> LazyFonts:
+    return LazyFonts(fonts_dir)
 
 
 def draw_grid(img: Image.Image) -> None:
-    grid = ImageDraw.Draw(img)
-    color = (99, 102, 241, 10)
-    for x in range(0, WIDTH, 40):
-        grid.line([(x, 0), (x, HEIGHT)], fill=color, width=1)
-    for y in range(0, HEIGHT, 40):
-        grid.line([(0, y), (WIDTH, y)], fill=color, width=1)
+    for x in range(0, WIDTH, GRID_STEP):
+        img.paste(GRID_LINE, (x, 0, x + 1, HEIGHT))
+    for y in range(0, HEIGHT, GRID_STEP):
+        img.paste(GRID_LINE, (0, y, WIDTH, y + 1))
+
+
+@functools.lru_cache(maxsize=1)
+def blank_canvas() -> Image.Image:
+    img = Image.new("RGB", (WIDTH, HEIGHT), BG)
+    draw_grid(img)
+    return img
 
 
 def section_well(draw: ImageDraw.ImageDraw, y1: int, y2: int) -> None:
@@ -274,43 +469,44 @@ def get_week_label(meta: Dict) -> str:
     return "Week N"
 
 
-def choose_tip(analysis: Dict) -> Tuple[str, float]:
-    recs = generate_recommendations(analysis)
+def choose_tip(analysis: Dict, recs: Optional[List[Dict]] = None) -> Tuple[str, float]:
+    if recs is None:
+        recs = generate_recommendations(analysis)
     cost_rec = next((r for r in recs if r.get("category") == "COST"), None)
     if not cost_rec:
         return ("No large leak detected this week; keep current config and monitor trends", 0.0)
-    impact = cost_rec.get("impact", "")
-    savings_match = re.search(r"\$([0-9]+(?:\.[0-9]+)?)", impact)
-    savings = float(savings_match.group(1)) if savings_match else 0.0
+    savings = cost_rec.get("savings_usd")
+    if savings is None:
+        savings_match = _MONEY_RE.search(cost_rec.get("impact", ""))
+        savings = float(savings_match.group(1)) if savings_match else 0.0
     return (cost_rec.get("text", "Tune cost settings"), savings)
 
 
-def build_metrics(analysis: Dict) -> Dict[str, float]:
-    tasks = as_dict(analysis.get("tasks"), "tasks")
-    cost = as_dict(analysis.get("cost"), "cost")
-    by_source = as_dict(cost.get("by_source"), "cost.by_source")
-    health = as_dict(analysis.get("health"), "health")
-    auto = as_dict(analysis.get("autonomous"), "autonomous")
-    skills = as_dict(analysis.get("skills"), "skills")
-    top_skill = (as_list(skills.get("top_used"), "skills.top_used") or [{}])[0]
+def build_metrics(analysis: Dict, view: Optional[AnalysisView] = None) -> Dict[str, float]:
+    if view is None:
+        view = AnalysisView.from_dict(analysis)
+    cost = view.cost
+    health = view.health
+    auto = view.auto
+    top_skill = as_dict((view.top_used or [{}])[0], "skills.top_used[0]")
 
-    asked = max(safe_int(tasks.get("asked"), 0), 1)
-    heartbeat_usd = safe_float(as_dict(by_source.get("heartbeats"), "cost.by_source.heartbeats").get("usd"))
-    self_usd = safe_float(as_dict(by_source.get("self_initiated"), "cost.by_source.self_initiated").get("usd"))
-    total_usd = max(safe_float(cost.get("total_usd")), 0.0001)
+    asked = view.asked
+    heartbeat_usd = view.heartbeat_usd
+    self_usd = view.self_usd
+    total_usd = max(view.total_usd, 0.0001)
     auto_total = max(safe_int(auto.get("total_actions"), 0), 1)
     three_am_total = max(safe_int(auto.get("three_am_sessions"), 0), 1)
 
     return {
-        "heartbeat_cost_pct": safe_float(as_dict(by_source.get("heartbeats"), "cost.by_source.heartbeats").get("pct")),
-        "unused_skills_count": float(len(as_list(skills.get("unused"), "skills.unused"))),
+        "heartbeat_cost_pct": safe_float(view.heartbeats.get("pct")),
+        "unused_skills_count": float(len(view.unused)),
         "three_am_sessions": float(safe_int(auto.get("three_am_sessions"), 0)),
         "three_am_useful_rate": safe_float(auto.get("three_am_useful")) / float(three_am_total),
         "error_rate": safe_float(health.get("error_rate")) or (safe_float(health.get("errors_total")) / float(asked)),
         "cost_per_task": safe_float(cost.get("per_completed_task_usd")),
         "read_write_ratio": safe_float(health.get("read_write_ratio")),
         "context_overflows": safe_float(health.get("context_overflows")),
-        "top_skill_pct": safe_float(as_dict(top_skill, "skills.top_used[0]").get("pct_of_total")),
+        "top_skill_pct": safe_float(top_skill.get("pct_of_total")),
         "self_initiated_cost_pct": (self_usd / total_usd) * 100.0,
         "autonomous_useful_rate": safe_float(auto.get("useful_count")) / float(auto_total),
         "tool_failures": safe_float(health.get("tool_failures")),
@@ -319,60 +515,87 @@ def build_metrics(analysis: Dict) -> Dict[str, float]:
     }
 
 
-def evaluate_condition(condition: str, metrics: Dict[str, float]) -> bool:
-    condition = (condition or "").strip()
-    if not condition:
-        return False
-
-    or_parts = [part.strip() for part in re.split(r"\s+OR\s+", condition, flags=re.IGNORECASE)]
-
-    def eval_clause(clause: str) -> bool:
-        and_parts = [part.strip() for part in re.split(r"\s+AND\s+", clause, flags=re.IGNORECASE)]
-        for expr in and_parts:
-            m = re.match(r"^([a-zA-Z0-9_]+)\s*(>=|<=|>|<|==|!=)\s*(-?[0-9]+(?:\.[0-9]+)?)$", expr)
-            if not m:
-                return False
-            key, op, value_s = m.groups()
-            left = float(metrics.get(key, 0.0))
-            right = float(value_s)
-            if op == ">" and not (left > right):
-                return False
-            if op == "<" and not (left < right):
-                return False
-            if op == ">=" and not (left >= right):
-                return False
-            if op == "<=" and not (left <= right):
-                return False
-            if op == "==" and not (left == right):
-                return False
-            if op == "!=" and not (left != right):
-                return False
-        return True
-
-    return any(eval_clause(clause) for clause in or_parts)
-
-
-def placeholder_values(analysis: Dict) -> Dict[str, str]:
-    tasks = as_dict(analysis.get("tasks"), "tasks")
-    cost = as_dict(analysis.get("cost"), "cost")
-    by_source = as_dict(cost.get("by_source"), "cost.by_source")
-    health = as_dict(analysis.get("health"), "health")
-    auto = as_dict(analysis.get("autonomous"), "autonomous")
-    skills = as_dict(analysis.get("skills"), "skills")
-    top_skill = (as_list(skills.get("top_used"), "skills.top_used") or [{"name": "github", "calls": 0, "pct_of_total": 0}])[0]
+def compile_condition(condition: str) -> Callable[[Dict[str, float]], bool]:
+    clauses: List[Tuple[Tuple[str, Callable[[float, float], bool], float], ...]] = []
+    exprs: List[Tuple[str, Callable[[float, float], bool], float]] = []
+    valid = True
+    want_expr = True
+    last_sep = ""
+
+    def close_clause() -> None:
+        if valid and exprs and not want_expr:
+            clauses.append(tuple(exprs))
+
+    for m in _COND_TOKEN_RE.finditer((condition or "").strip()):
+        keyword = (m.group("bool") or "").upper()
+        # A keyword straight after a separator is literal text, as it was for the
+        # split-based parser; only OR still separates after AND.
+        if keyword and (last_sep == "OR" or last_sep == keyword):
+            valid = False
+            last_sep = ""
+            continue
+        last_sep = keyword
+        if keyword:
+            if want_expr:
+                valid = False
+            if keyword == "OR":
+                close_clause()
+                exprs, valid = [], True
+            want_expr = True
+        elif m.group("key"):
+            if not want_expr:
+                valid = False
+            exprs.append((m.group("key"), _OPERATORS[m.group("op")], float(m.group("val"))))
+            want_expr = False
+        else:
+            valid = False
+    close_clause()
+
+    def evaluate(metrics: Dict[str, float]) -> bool:
+        return any(
+            all(op(float(metrics.get(key, 0.0)), right) for key, op, right in clause)
+            for clause in clauses
+        )
+
+    return evaluate
+
+
+@functools.lru_cache(maxsize=4)
+def _compiled_patterns(rec_path: Path, mtime_ns: int) -> List[Tuple[Dict, Callable[[Dict[str, float]], bool]]]:
+    pattern_data = load_json(rec_path).get("patterns", [])
+    ordered = sorted(pattern_data, key=lambda p: safe_int(as_dict(p, "recommendation.pattern").get("priority"), 99))
+    return [(pattern, compile_condition(str(pattern.get("condition", "")))) for pattern in ordered]
+
+
+def load_recommendation_patterns(rec_path: Path) -> List[Tuple[Dict, Callable[[Dict[str, float]], bool]]]:
+    return _compiled_patterns(rec_path, rec_path.stat().st_mtime_ns)
+
+
+def placeholder_values(analysis: Dict, view: Optional[AnalysisView] = None) -> Dict[str, str]:
+    if view is None:
+        view = AnalysisView.from_dict(analysis)
+    tasks = view.tasks
+    cost = view.cost
+    health = view.health
+    auto = view.auto
+    skills = view.skills
+    rating = view.rating
+    notable = view.notable
+    top_skill = as_dict(
+        (view.top_used or [{"name": "github", "calls": 0, "pct_of_total": 0}])[0],
+        "skills.top_used[0]",
+    )
 
     three_am_sessions = safe_int(auto.get("three_am_sessions"), 0)
     three_am_useful = safe_int(auto.get("three_am_useful"), 0)
-    completion = safe_float(tasks.get("completion_rate"), 0.0)
-    completed = safe_int(tasks.get("completed"), 0)
-    asked = max(safe_int(tasks.get("asked"), 0), 1)
-    total_cost = safe_float(cost.get("total_usd"), 0.0)
-    heartbeat = safe_float(as_dict(by_source.get("heartbeats"), "cost.by_source.heartbeats").get("usd"), 0.0)
-    self_usd = safe_float(as_dict(by_source.get("self_initiated"), "cost.by_source.self_initiated").get("usd"), 0.0)
-    error_rate = safe_float(health.get("error_rate"), 0.0)
-    if error_rate <= 0:
-        error_rate = safe_float(health.get("errors_total"), 0.0) / float(asked)
-    unused = as_list(skills.get("unused"), "skills.unused")
+    completion = view.completion_rate
+    completed = view.completed
+    asked = view.asked
+    total_cost = view.total_usd
+    heartbeat = view.heartbeat_usd
+    self_usd = view.self_usd
+    error_rate = view.error_rate
+    unused = view.unused
     reduction_pct = 0
     if total_cost > 0:
         reduction_pct = int(round((heartbeat / total_cost) * 35))
@@ -381,7 +604,7 @@ def placeholder_values(analysis: Dict) -> Dict[str, str]:
     overnight_cost = heartbeat * 0.22
     token_savings = max(80, len(unused) * 42)
     cost_per_task = safe_float(cost.get("per_completed_task_usd"), 0.0)
-    prev_completion_rate = (analysis.get("rating") or {}).get("previous_task_completion_rate")
+    prev_completion_rate = rating.get("previous_task_completion_rate")
     if prev_completion_rate is None:
         completion_hist = as_list(tasks.get("trend"), "tasks.trend")
         if completion_hist:
@@ -403,7 +626,7 @@ def placeholder_values(analysis: Dict) -> Dict[str, str]:
         heartbeat_useful_pct = str(int(round(safe_float(heartbeat_useful_rate) * 100)))
     risky_count = auto.get("risky_count")
     if not isinstance(risky_count, int):
-        risky_count = len([x for x in as_list(auto.get("notable"), "autonomous.notable") if as_dict(x, "autonomous.notable[]").get("verdict") == "risky"])
+        risky_count = len([x for x in notable if as_dict(x, "autonomous.notable[]").get("verdict") == "risky"])
 
     return {
         "completed_tasks": str(completed),
@@ -414,30 +637,26 @@ def placeholder_values(analysis: Dict) -> Dict[str, str]:
         "cost_per_task": f"{cost_per_task:.2f}",
         "completion_rate": f"{int(round(completion * 100))}",
         "prev_completion": prev_completion_pct,
-        "heartbeat_pct": str(safe_int(as_dict(by_source.get("heartbeats"), "cost.by_source.heartbeats").get("pct"), 0)),
+        "heartbeat_pct": str(safe_int(view.heartbeats.get("pct"), 0)),
         "heartbeat_cost": f"{heartbeat:.2f}",
         "heartbeat_useful_pct": heartbeat_useful_pct,
         "errors_total": str(safe_int(health.get("errors_total"), 0)),
         "errors_fixed": "",
-        "autonomous_notable_desc": as_dict((as_list(auto.get("notable"), "autonomous.notable") or [{"summary": "status checks"}])[0], "autonomous.notable[0]").get("summary", "status checks"),
+        "autonomous_notable_desc": as_dict((notable or [{"summary": "status checks"}])[0], "autonomous.notable[0]").get("summary", "status checks"),
         "autonomous_actions": str(safe_int(auto.get("total_actions"), 0)),
         "autonomous_useful_pct": str(int(round(safe_float(auto.get("useful_rate")) * 100))),
-        "errors_self_caused": str(safe_int(health.get("errors_self_caused"), 0)),
+        "errors_self_caused": str(view.errors_self_caused),
         "read_write_ratio": str(safe_int(health.get("read_write_ratio"), 0)),
         "reads_total": str(int(read_calls)) if read_calls is not None else "",
         "writes_total": str(int(write_calls)) if write_calls is not None else "",
         "context_overflows": str(safe_int(health.get("context_overflows"), 0)),
         "tool_calls_total": str(safe_int(auto.get("total_actions"), 0)),
         "risky_actions": str(risky_count),
-        "rating_title": str(as_dict(analysis.get("rating"), "rating").get("title", "Unpaid Intern")),
-        "percentile": str(safe_int(as_dict(analysis.get("rating"), "rating").get("percentile"), 50)),
-        "previous_rating": str(
-            (analysis.get("rating") or {}).get(
-                "previous_title", (analysis.get("rating") or {}).get("title", "Unpaid Intern")
-            )
-        ),
+        "rating_title": str(rating.get("title", "Unpaid Intern")),
+        "percentile": str(safe_int(rating.get("percentile"), 50)),
+        "previous_rating": str(rating.get("previous_title", rating.get("title", "Unpaid Intern"))),
         "self_initiated_cost": f"{self_usd:.2f}",
-        "self_initiated_count": str(safe_int(as_dict(by_source.get("self_initiated"), "cost.by_source.self_initiated").get("count"), 0)),
+        "self_initiated_count": str(safe_int(view.self_initiated.get("count"), 0)),
         "avg_response_seconds": f"{safe_float(health.get('avg_response_seconds'), 0.0):.1f}",
         "completion_delta": completion_delta,
         "three_am_sessions": str(three_am_sessions),
@@ -459,61 +678,69 @@ def placeholder_values(analysis: Dict) -> Dict[str, str]:
         "overnight_cost": f"{overnight_cost:.2f}",
         "suggested_threshold": "120000",
         "suggested_confidence": "0.75",
-        "top_skill_name": str(as_dict(top_skill, "skills.top_used[0]").get("name", "github")),
-        "top_skill_pct": str(safe_int(as_dict(top_skill, "skills.top_used[0]").get("pct_of_total"), 0)),
+        "top_skill_name": str(top_skill.get("name", "github")),
+        "top_skill_pct": str(safe_int(top_skill.get("pct_of_total"), 0)),
     }
 
 
-def generate_recommendations(analysis: Dict) -> List[Dict[str, str]]:
-    tasks = as_dict(analysis.get("tasks"), "tasks")
-    cost = as_dict(analysis.get("cost"), "cost")
-    by_source = as_dict(cost.get("by_source"), "cost.by_source")
-    health = as_dict(analysis.get("health"), "health")
-    auto = as_dict(analysis.get("autonomous"), "autonomous")
-    skills = as_dict(analysis.get("skills"), "skills")
+def generate_recommendations(
+    analysis: Dict,
+    values: Optional[Dict[str, str]] = None,
+    view: Optional[AnalysisView] = None,
+) -> List[Dict]:
+    if view is None:
+        view = AnalysisView.from_dict(analysis)
+    health = view.health
+    auto = view.auto
 
     repo_root = Path(__file__).resolve().parent.parent
     rec_path = repo_root / "references" / "recommendations.json"
-    values = placeholder_values(analysis)
-    metrics = build_metrics(analysis)
-    recs: List[Dict[str, str]] = []
+    if values is None:
+        values = placeholder_values(analysis, view=view)
+    metrics = build_metrics(analysis, view=view)
+    recs: List[Dict] = []
 
-    if rec_path.exists():
-        try:
-            pattern_data = load_json(rec_path).get("patterns", [])
-            for pattern in sorted(pattern_data, key=lambda p: safe_int(as_dict(p, "recommendation.pattern").get("priority"), 99)):
-                if not evaluate_condition(str(pattern.get("condition", "")), metrics):
-                    continue
-                text = fill_template(str(pattern.get("template", "")), values)
-                impact = fill_template(str(pattern.get("impact", "")), values)
-                recs.append(
-                    {
-                        "category": str(pattern.get("category", "EFFICIENCY")),
-                        "text": text,
-                        "impact": impact,
-                        "config_change": str(pattern.get("config_change") or ""),
-                    }
-                )
-        except Exception as exc:
-            warn(f"failed evaluating recommendations from {rec_path}: {exc}")
-            recs = []
+    try:
+        for pattern, matches in load_recommendation_patterns(rec_path):
+            if not matches(metrics):
+                continue
+            impact_template = str(pattern.get("impact", ""))
+            text = fill_template(str(pattern.get("template", "")), values)
+            impact = fill_template(impact_template, values)
+            money = _MONEY_PLACEHOLDER_RE.search(impact_template)
+            recs.append(
+                {
+                    "category": str(pattern.get("category", "EFFICIENCY")),
+                    "text": text,
+                    "impact": impact,
+                    "config_change": str(pattern.get("config_change") or ""),
+                    "savings_usd": safe_float(values.get(money.group(1))) if money else None,
+                }
+            )
+    except FileNotFoundError:
+        recs = []
+    except Exception as exc:
+        warn(f"failed evaluating recommendations from {rec_path}: {exc}")
+        recs = []
 
     if recs:
         return recs[:3]
 
     heartbeat_pct = safe_float(values.get("heartbeat_pct"), 0.0)
-    heartbeat_usd = safe_float(as_dict(by_source.get("heartbeats"), "cost.by_source.heartbeats").get("usd"))
+    heartbeat_usd = view.heartbeat_usd
+    unused = view.unused
     if heartbeat_pct > 30:
         recs.append(
             {
                 "category": "COST",
                 "text": "Switch heartbeat model to a cheaper default and limit overnight windows",
                 "impact": f"Expected savings: ${heartbeat_usd * 0.35:,.2f}/week",
+                "savings_usd": round(heartbeat_usd * 0.35, 2),
             }
         )
 
-    if len(as_list(skills.get("unused"), "skills.unused")) > 3:
-        names = ", ".join(as_list(skills.get("unused"), "skills.unused")[:4])
+    if len(unused) > 3:
+        names = ", ".join(unused[:4])
         recs.append(
             {
                 "category": "CLEANUP",
@@ -522,8 +749,7 @@ def generate_recommendations(analysis: Dict) -> List[Dict[str, str]]:
             }
         )
 
-    asked = max(safe_int(tasks.get("asked"), 0), 1)
-    error_rate = safe_float(health.get("error_rate")) or (safe_float(health.get("errors_total")) / asked)
+    error_rate = safe_float(health.get("error_rate")) or (safe_float(health.get("errors_total")) / view.asked)
     if error_rate > 0.1:
         recs.append(
             {
@@ -574,22 +800,32 @@ def generate_recommendations(analysis: Dict) -> List[Dict[str, str]]:
     return recs[:3]
 
 
-def fill_template(template: str, data: Dict[str, str]) -> str:
-    out = template
-    for k, v in data.items():
-        out = out.replace("{" + k + "}", str(v))
-    return out
+def fill_template(template: str, data: Dict[str, str], default: Optional[str] = None) -> str:
+
+    def substitute(m: re.Match) -> str:
+        key = m.group(0)[1:-1]
+        if key in data:
+            return str(data[key])
+        return m.group(0) if default is None else default
+
+    return _PLACEHOLDER_RE.sub(substitute, template)
 
 
-def choose_manager_note(analysis: Dict, roasts_path: Path, seed: Optional[int] = None) -> str:
+def choose_manager_note(
+    analysis: Dict,
+    roasts_path: Path,
+    seed: Optional[int] = None,
+    values: Optional[Dict[str, str]] = None,
+    recs: Optional[List[Dict]] = None,
+) -> str:
     template = (
         "Completion rate is {completion_rate}% on ${total_cost} weekly spend. "
         "Autonomous work logged {autonomous_actions} actions with {autonomous_useful_pct}% usefulness. "
         "Current rating: {rating_title}. Recommendation: {recommendation_summary}."
     )
 
-    values = placeholder_values(analysis)
-    recommendations = generate_recommendations(analysis)
+    values = dict(values) if values is not None else placeholder_values(analysis)
+    recommendations = recs if recs is not None else generate_recommendations(analysis, values=values)
     if recommendations:
         values["recommendation_summary"] = recommendations[0].get("text", values["recommendation_summary"])
 
@@ -608,14 +844,12 @@ def choose_manager_note(analysis: Dict, roasts_path: Path, seed: Optional[int] =
         if seed is None:
             period = (analysis.get("meta", {}).get("period", {}) or {}).get("end", "week")
             agent = analysis.get("meta", {}).get("agent_id", "agent")
-            digest = hashlib.sha256(f"{agent}:{period}".encode("utf-8")).hexdigest()[:8]
-            seed = int(digest, 16)
+            seed = zlib.crc32(f"{agent}:{period}".encode("utf-8"))
         # Deterministic template choice only; not used for cryptography.
         rng = random.Random(seed)  # nosec B311
         template = rng.choice(candidates).get("template", template)
 
-    rendered = fill_template(template, values)
-    return re.sub(r"\{[a-zA-Z0-9_]+\}", "n/a", rendered)
+    return fill_template(template, values, default="n/a")
 
 
 def draw_stacked_bar(
@@ -625,7 +859,7 @@ def draw_stacked_bar(
     w: int,
     h: int,
     values: Sequence[Tuple[str, float]],
-    fonts: Dict[str, ImageFont.FreeTypeFont],
+    fonts: LazyFonts,
 ) -> None:
     total = sum(v for _, v in values)
     cursor = x
@@ -633,6 +867,8 @@ def draw_stacked_bar(
         draw_rounded_box(draw, (x, y, x + w, y + h), fill="#0f1320", outline=DIVIDER, radius=8)
         return
 
+    label_font = fonts["mono_sm"]
+    advance = mono_advance(label_font)
     for idx, (key, amount) in enumerate(values):
         seg = int(round((amount / total) * w))
         if idx == len(values) - 1:
@@ -642,8 +878,8 @@ def draw_stacked_bar(
         color = SOURCE_COLORS.get(key, "#3d4250")
         draw.rectangle((cursor, y, cursor + seg, y + h), fill=color)
         label = f"${amount:.2f}"
-        if seg > text_width(draw, label, fonts["mono_sm"]) + 14:
-            draw.text((cursor + 7, y + 4), label, fill="#0b0d12", font=fonts["mono_sm"])
+        if seg > int(len(label) * advance) + 14:
+            cached_text(draw, (cursor + 7, y + 4), label, fill="#0b0d12", font=label_font)
         cursor += seg
 
     draw.rounded_rectangle((x, y, x + w, y + h), radius=8, outline=DIVIDER, width=1)
@@ -658,26 +894,17 @@ def draw_sparkline(
     values: List[float],
     color: str,
 ) -> None:
-    sanitized: List[float] = []
-    for raw in values:
-        val = safe_float(raw, 0.0)
-        if math.isfinite(val):
-            sanitized.append(val)
-    values = sanitized
+    values = [safe_float(raw, 0.0) for raw in values]
+    draw.rectangle((x, y, x + w, y + h), outline=DIVIDER, width=1)
     if not values:
-        draw.rectangle((x, y, x + w, y + h), outline=DIVIDER, width=1)
         return
 
     lo = min(values)
     hi = max(values)
     span = (hi - lo) or 1.0
-    points = []
-    for i, v in enumerate(values):
-        px = x + int(i * (w / max(1, len(values) - 1)))
-        py = y + h - int(((v - lo) / span) * h)
-        points.append((px, py))
+    step = w / max(1, len(values) - 1)
+    points = [(x + int(i * step), y + h - int(((v - lo) / span) * h)) for i, v in enumerate(values)]
 
-    draw.rectangle((x, y, x + w, y + h), outline=DIVIDER, width=1)
     if len(points) > 1:
         draw.line(points, fill=color, width=3, joint="curve")
     else:
@@ -694,44 +921,47 @@ def render_card(
     assets_dir: Path,
     refs_dir: Path,
     seed: Optional[int] = None,
+    png8: bool = False,
 ) -> None:
     if not fonts_dir.exists():
         raise CardGenerationError(f"fonts directory does not exist: {fonts_dir}")
     fonts = load_fonts(fonts_dir)
 
-    img = Image.new("RGBA", (WIDTH, HEIGHT), BG)
-    draw_grid(img)
+    img = blank_canvas().copy()
     draw = ImageDraw.Draw(img)
 
+    view = AnalysisView.from_dict(analysis)
     meta = as_dict(analysis.get("meta"), "meta")
     period = as_dict(meta.get("period"), "meta.period")
-    tasks = as_dict(analysis.get("tasks"), "tasks")
-    cost = as_dict(analysis.get("cost"), "cost")
-    auto = as_dict(analysis.get("autonomous"), "autonomous")
-    skills = as_dict(analysis.get("skills"), "skills")
-    health = as_dict(analysis.get("health"), "health")
-    rating = as_dict(analysis.get("rating"), "rating")
+    tasks = view.tasks
+    cost = view.cost
+    auto = view.auto
+    skills = view.skills
+    health = view.health
+    rating = view.rating
 
     week_label = get_week_label(meta)
 
     # Header row
-    draw.text((36, 22), "CONFIDENTIAL", fill="#dc2626", font=fonts["bold"])
-    draw.text(
+    cached_text(draw, (36, 22), "CONFIDENTIAL", fill="#dc2626", font=fonts["bold"])
+    cached_text(
+        draw,
         (36, 52),
         f"WEEKLY PERFORMANCE REVIEW · {period.get('start', '?')} to {period.get('end', '?')}",
         fill=TEXT_DIM,
         font=fonts["mono_sm"],
     )
-    draw.text((WIDTH - 36, 20), week_label, fill=TEXT_BRIGHT, font=fonts["heading"], anchor="ra")
+    cached_text(draw, (WIDTH - 36, 20), week_label, fill=TEXT_BRIGHT, font=fonts["heading"], anchor="ra")
     uptime = f"Uptime: {safe_int(period.get('days'), 0)}d window"
-    draw.text((WIDTH - 36, 52), uptime, fill=TEXT_MED, font=fonts["mono_sm"], anchor="ra")
+    cached_text(draw, (WIDTH - 36, 52), uptime, fill=TEXT_MED, font=fonts["mono_sm"], anchor="ra")
 
     # Agent + rating
     section_well(draw, 80, 168)
     agent_name = safe_text(meta.get("agent_id", "main"), default="main", max_len=60)
     host = safe_text(meta.get("hostname", "unknown"), default="unknown", max_len=80)
-    draw.text((48, 98), agent_name, fill=TEXT_BRIGHT, font=fonts["title"])
-    draw.text(
+    cached_text(draw, (48, 98), agent_name, fill=TEXT_BRIGHT, font=fonts["title"])
+    cached_text(
+        draw,
         (48, 146),
         f"Dept: {host} · Role: Unclear · Status: 'Working'",
         fill=TEXT_MED,
@@ -746,7 +976,7 @@ def render_card(
     by1 = 95
     by2 = by1 + badge_h
     draw_rounded_box(draw, (bx1, by1, bx2, by2), fill="#0d1220", outline=rating_color, width=2, radius=12)
-    draw.text((bx1 + 14, by1 + 14), rating_title, fill=rating_color, font=fonts["heading"])
+    cached_text(draw, (bx1 + 14, by1 + 14), rating_title, fill=rating_color, font=fonts["heading"])
 
     prev = safe_text(rating.get("previous_title", rating_title), default=rating_title, max_len=32)
     if prev == rating_title:
@@ -754,61 +984,63 @@ def render_card(
     else:
         sign = "↑" if rating.get("improved") else "↓"
         delta_line = f"{sign} from {prev} · Top {safe_int(rating.get('percentile'), 50)}%"
-    draw.text((bx2, by2 + 12), delta_line, fill=TEXT_MED, font=fonts["mono_sm"], anchor="ra")
+    cached_text(draw, (bx2, by2 + 12), delta_line, fill=TEXT_MED, font=fonts["mono_sm"], anchor="ra")
 
     # Money section
     section_well(draw, 176, 325)
-    total_cost = safe_float(cost.get("total_usd"), 0.0)
-    draw.text(
+    total_cost = view.total_usd
+    cached_text(
+        draw,
         (48, 192),
         f"WHERE YOUR MONEY GOES · ${fmt_money(total_cost)} THIS WEEK",
         fill=TEXT_BRIGHT,
         font=fonts["heading"],
     )
 
-    sources = as_dict(cost.get("by_source"), "cost.by_source")
-    bar_values = [
-        ("user_requests", safe_float(as_dict(sources.get("user_requests"), "cost.by_source.user_requests").get("usd"), 0.0)),
-        ("heartbeats", safe_float(as_dict(sources.get("heartbeats"), "cost.by_source.heartbeats").get("usd"), 0.0)),
-        ("cron_jobs", safe_float(as_dict(sources.get("cron_jobs"), "cost.by_source.cron_jobs").get("usd"), 0.0)),
-        ("self_initiated", safe_float(as_dict(sources.get("self_initiated"), "cost.by_source.self_initiated").get("usd"), 0.0)),
-    ]
-    draw_stacked_bar(draw, 48, 232, WIDTH - 96, 36, bar_values, fonts)
+    sources = view.by_source
+    src_dicts = {key: as_dict(sources.get(key), f"cost.by_source.{key}") for key in SOURCE_COLORS}
+    bar_values = [(key, safe_float(src.get("usd"), 0.0)) for key, src in src_dicts.items()]
+    draw_stacked_bar(draw, 48, 232, CONTENT_W, 36, bar_values, fonts)
 
     lx = 48
     ly = 275
     for key, _ in bar_values:
-        pct = safe_int(as_dict(sources.get(key), f"cost.by_source.{key}").get("pct"), 0)
+        pct = safe_int(src_dicts[key].get("pct"), 0)
         label = key.replace("_", " ")
         color = SOURCE_COLORS[key]
         draw.ellipse((lx, ly + 4, lx + 10, ly + 14), fill=color)
-        draw.text((lx + 16, ly), f"{label} {pct}%", fill=TEXT_MED, font=fonts["mono_sm"])
+        cached_text(draw, (lx + 16, ly), f"{label} {pct}%", fill=TEXT_MED, font=fonts["mono_sm"])
         lx += 270
 
-    tip, savings = choose_tip(analysis)
+    values = placeholder_values(analysis, view=view)
+    recs = generate_recommendations(analysis, values=values, view=view)
+    tip, savings = choose_tip(analysis, recs=recs)
     tip_fill = "#112016" if savings >= 2 else "#171c28"
-    draw_rounded_box(draw, (48, 294, WIDTH - 48, 319), fill=tip_fill, outline=DIVIDER, radius=8)
+    draw_rounded_box(draw, (48, 294, CONTENT_RIGHT, 319), fill=tip_fill, outline=DIVIDER, radius=8)
     tip_text = f"TIP: {tip}"
     if savings >= 2:
         tip_text += f" → -${savings:.2f}/wk"
-    draw.text((56, 298), tip_text, fill=TEXT_MED, font=fonts["body_xs"])
+    cached_text(draw, (56, 298), tip_text, fill=TEXT_MED, font=fonts["body_xs"])
 
     # Tasks section
     section_well(draw, 334, 516)
     asked = safe_int(tasks.get("asked"), 0)
-    completed = safe_int(tasks.get("completed"), 0)
-    draw.text(
+    completed = view.completed
+    cached_text(
+        draw,
         (48, 350),
-        f"WHAT YOU ASKED FOR · {completed}/{asked} COMPLETED ({fmt_pct(safe_float(tasks.get('completion_rate'), 0.0))})",
+        f"WHAT YOU ASKED FOR · {completed}/{asked} COMPLETED ({fmt_pct(view.completion_rate)})",
         fill=TEXT_BRIGHT,
         font=fonts["heading"],
     )
 
-    highlights = as_list(tasks.get("highlights"), "tasks.highlights")[:5]
+    highlights = [as_dict(item, "tasks.highlights[]") for item in as_list(tasks.get("highlights"), "tasks.highlights")[:5]]
     y = 390
-    for item in highlights:
-        item_d = as_dict(item, "tasks.highlights[]")
+    completed_in_rows = 0
+    for item_d in highlights:
         status = item_d.get("status", "in_progress")
+        if status == "completed":
+            completed_in_rows += 1
         icon = "✓" if status == "completed" else ("✗" if status == "failed" else "◌")
         color = "#22c55e" if status == "completed" else ("#dc2626" if status == "failed" else TEXT_DIM)
         summary = safe_text(item_d.get("summary"), default="(untitled task)", max_len=52)
@@ -820,28 +1052,25 @@ def render_card(
             else:
                 dur_str = f"{int(dur)}s"
 
-        draw.text((56, y), icon, fill=color, font=fonts["bold"])
-        draw.text((80, y), summary, fill=TEXT_MED, font=fonts["body_sm"])
-        draw.text((860, y), dur_str, fill=TEXT_DIM, font=fonts["mono_sm"])
+        cached_text(draw, (56, y), icon, fill=color, font=fonts["bold"])
+        cached_text(draw, (80, y), summary, fill=TEXT_MED, font=fonts["body_sm"])
+        cached_text(draw, (860, y), dur_str, fill=TEXT_DIM, font=fonts["mono_sm"])
 
         model = safe_text(item_d.get("model"), default="unknown", max_len=26)
         pw = text_width(draw, model, fonts["mono_xs"]) + 16
-        px1 = WIDTH - 56 - pw
-        draw_rounded_box(draw, (px1, y - 1, WIDTH - 56, y + 20), fill="#121826", outline=DIVIDER, radius=10)
-        draw.text((px1 + 8, y + 2), model, fill=TEXT_DIM, font=fonts["mono_xs"])
+        px1 = ROW_RIGHT - pw
+        draw_rounded_box(draw, (px1, y - 1, ROW_RIGHT, y + 20), fill="#121826", outline=DIVIDER, radius=10)
+        cached_text(draw, (px1 + 8, y + 2), model, fill=TEXT_DIM, font=fonts["mono_xs"])
 
         if status == "failed" and item_d.get("failure_reason"):
-            draw.text((82, y + 19), safe_text(item_d.get("failure_reason"), default="failure", max_len=56), fill="#dc2626", font=fonts["body_xs"])
+            cached_text(draw, (82, y + 19), safe_text(item_d.get("failure_reason"), default="failure", max_len=56), fill="#dc2626", font=fonts["body_xs"])
             y += 36
         else:
             y += 29
 
-    completed_in_rows = 0
-    for h in highlights:
-        if as_dict(h, "tasks.highlights[]").get("status") == "completed":
-            completed_in_rows += 1
-    extra_completed = max(0, safe_int(tasks.get("completed"), 0) - completed_in_rows)
-    draw.text(
+    extra_completed = max(0, completed - completed_in_rows)
+    cached_text(
+        draw,
         (48, 495),
         f"+ {extra_completed} more completed · {safe_int(tasks.get('in_progress'), 0)} in progress",
         fill=TEXT_DIM,
@@ -853,45 +1082,38 @@ def render_card(
     useful = safe_int(auto.get("useful_count"), 0)
     total_actions = safe_int(auto.get("total_actions"), 0)
     useful_rate = safe_float(auto.get("useful_rate"), 0.0)
-    draw.text(
+    cached_text(
+        draw,
         (48, 540),
         f"AUTONOMOUS ACTIVITY · {total_actions} ACTIONS, {useful} USEFUL ({fmt_pct(useful_rate)})",
         fill=TEXT_BRIGHT,
         font=fonts["heading"],
     )
 
-    verdict_colors = {
-        "helpful": "#22c55e",
-        "unnecessary": "#f97316",
-        "partial": "#3b82f6",
-        "risky": "#dc2626",
-    }
-    verdict_icons = {"helpful": "▲", "unnecessary": "■", "partial": "◆", "risky": "⚠"}
-
     y = 576
-    notable = as_list(auto.get("notable"), "autonomous.notable")[:5]
+    notable = view.notable[:5]
     for act in notable:
         act_d = as_dict(act, "autonomous.notable[]")
         verdict = (str(act_d.get("verdict") or "unnecessary")).lower()
-        color = verdict_colors.get(verdict, TEXT_DIM)
-        icon = verdict_icons.get(verdict, "■")
+        color, icon = VERDICT_STYLES.get(verdict, (TEXT_DIM, "■"))
         ts = safe_text(act_d.get("timestamp"), default="", max_len=40)
         ts_short = ts[5:16].replace("T", " ") if len(ts) >= 16 else ts
 
-        draw.text((56, y), icon, fill=color, font=fonts["bold"])
-        draw.text((84, y), ts_short, fill=TEXT_DIM, font=fonts["mono_sm"])
-        draw.text((238, y), safe_text(act_d.get("summary"), default="Autonomous action", max_len=56), fill=TEXT_MED, font=fonts["body_sm"])
+        cached_text(draw, (56, y), icon, fill=color, font=fonts["bold"])
+        cached_text(draw, (84, y), ts_short, fill=TEXT_DIM, font=fonts["mono_sm"])
+        cached_text(draw, (238, y), safe_text(act_d.get("summary"), default="Autonomous action", max_len=56), fill=TEXT_MED, font=fonts["body_sm"])
 
         pill = verdict.capitalize()
         pw = text_width(draw, pill, fonts["mono_xs"]) + 16
-        px1 = WIDTH - 56 - pw
-        draw_rounded_box(draw, (px1, y - 1, WIDTH - 56, y + 20), fill="#141722", outline=color, radius=10)
-        draw.text((px1 + 8, y + 2), pill, fill=color, font=fonts["mono_xs"])
+        px1 = ROW_RIGHT - pw
+        draw_rounded_box(draw, (px1, y - 1, ROW_RIGHT, y + 20), fill="#141722", outline=color, radius=10)
+        cached_text(draw, (px1 + 8, y + 2), pill, fill=color, font=fonts["mono_xs"])
         y += 24
 
     status_checks = max(0, total_actions - useful)
     status_pct = int(round((status_checks / max(total_actions, 1)) * 100))
-    draw.text(
+    cached_text(
+        draw,
         (48, 673),
         f"+ {max(0, total_actions - len(notable))} other actions ({status_pct}% were status checks)",
         fill=TEXT_DIM,
@@ -900,32 +1122,31 @@ def render_card(
 
     # Skills + health
     section_well(draw, 703, 900)
-    draw.line((WIDTH // 2, 720, WIDTH // 2, 884), fill=DIVIDER, width=1)
+    draw.line((MID_X, 720, MID_X, 884), fill=DIVIDER, width=1)
 
-    draw.text((48, 720), f"SKILLS · {safe_int(skills.get('used'), 0)} OF {safe_int(skills.get('installed'), 0)} USED", fill=TEXT_BRIGHT, font=fonts["heading"])
+    cached_text(draw, (48, 720), f"SKILLS · {safe_int(skills.get('used'), 0)} OF {safe_int(skills.get('installed'), 0)} USED", fill=TEXT_BRIGHT, font=fonts["heading"])
     sy = 754
-    top_skills = as_list(skills.get("top_used"), "skills.top_used")[:4]
-    max_calls = max([safe_int(as_dict(s, "skills.top_used[]").get("calls"), 0) for s in top_skills] + [1])
-    for s in top_skills:
-        s_d = as_dict(s, "skills.top_used[]")
+    top_skills = [as_dict(s, "skills.top_used[]") for s in view.top_used[:4]]
+    skill_calls = [safe_int(s_d.get("calls"), 0) for s_d in top_skills]
+    max_calls = max(max(skill_calls, default=1), 1)
+    for s_d, calls in zip(top_skills, skill_calls):
         name = safe_text(s_d.get("name"), default="skill", max_len=18)
-        calls = safe_int(s_d.get("calls"), 0)
         bw = int((calls / max_calls) * 180)
-        draw.text((56, sy), name[:18], fill=TEXT_MED, font=fonts["mono_sm"])
+        cached_text(draw, (56, sy), name[:18], fill=TEXT_MED, font=fonts["mono_sm"])
         draw.rectangle((204, sy + 4, 204 + bw, sy + 16), fill="#3b82f6")
-        draw.text((392, sy), str(calls), fill=TEXT_DIM, font=fonts["mono_sm"])
+        cached_text(draw, (392, sy), str(calls), fill=TEXT_DIM, font=fonts["mono_sm"])
         sy += 26
 
-    unused = as_list(skills.get("unused"), "skills.unused")
+    unused = view.unused
     if unused:
-        draw_rounded_box(draw, (48, 854, WIDTH // 2 - 24, 892), fill="#271417", outline="#4a1d24", radius=8)
+        draw_rounded_box(draw, (48, 854, LEFT_COL_RIGHT, 892), fill="#271417", outline="#4a1d24", radius=8)
         unused_text = ", ".join([safe_text(u, default="skill", max_len=20) for u in unused[:5]])
-        draw.text((56, 865), f"IDLE {len(unused)}: {unused_text}", fill="#fca5a5", font=fonts["mono_xs"])
+        cached_text(draw, (56, 865), f"IDLE {len(unused)}: {unused_text}", fill="#fca5a5", font=fonts["mono_xs"])
 
-    draw.text((WIDTH // 2 + 24, 720), "SYSTEM HEALTH", fill=TEXT_BRIGHT, font=fonts["heading"])
+    cached_text(draw, (RIGHT_COL_X, 720), "SYSTEM HEALTH", fill=TEXT_BRIGHT, font=fonts["heading"])
     health_rows = [
-        ("Errors caused / fixed", f"{safe_int(health.get('errors_self_caused'), 0)} / {max(0, safe_int(tasks.get('completed'), 0) - safe_int(tasks.get('failed'), 0))}"),
-        ("Self-caused errors", str(safe_int(health.get("errors_self_caused"), 0))),
+        ("Errors caused / fixed", f"{view.errors_self_caused} / {max(0, completed - safe_int(tasks.get('failed'), 0))}"),
+        ("Self-caused errors", str(view.errors_self_caused)),
         ("Context overflows", str(safe_int(health.get("context_overflows"), 0))),
         ("Avg response", f"{safe_float(health.get('avg_response_seconds'), 0.0)}s"),
         ("Read/write ratio", f"{safe_int(health.get('read_write_ratio'), 0)}:1"),
@@ -937,22 +1158,20 @@ def render_card(
         val_color = "#dc2626" if ("error" in label.lower() and first_num > 10) else TEXT_MED
         if "Context overflows" in label and safe_int(val, 0) > 0:
             val_color = "#dc2626"
-        draw.text((WIDTH // 2 + 28, hy), label, fill=TEXT_DIM, font=fonts["mono_sm"])
-        draw.text((WIDTH - 56, hy), val, fill=val_color, font=fonts["mono_sm"], anchor="ra")
+        cached_text(draw, (RIGHT_COL_X + 4, hy), label, fill=TEXT_DIM, font=fonts["mono_sm"])
+        cached_text(draw, (ROW_RIGHT, hy), val, fill=val_color, font=fonts["mono_sm"], anchor="ra")
         hy += 24
 
     # Trends
     section_well(draw, 908, 1052)
-    draw.text((48, 924), "TRENDS · 7-WEEK HISTORY", fill=TEXT_BRIGHT, font=fonts["heading"])
+    cached_text(draw, (48, 924), "TRENDS · 7-WEEK HISTORY", fill=TEXT_BRIGHT, font=fonts["heading"])
 
     cost_trend = [safe_float(as_dict(x, "cost.trend[]").get("value"), 0.0) for x in as_list(cost.get("trend"), "cost.trend")][-6:]
     completion_trend_hist = [safe_float(as_dict(x, "tasks.trend[]").get("value"), 0.0) for x in as_list(tasks.get("trend"), "tasks.trend")][-6:]
     error_trend_hist = [safe_float(as_dict(x, "health.error_rate_trend[]").get("value"), 0.0) for x in as_list(health.get("error_rate_trend"), "health.error_rate_trend")][-6:]
 
-    completion_current = safe_float(tasks.get("completion_rate"), 0.0) * 100
-    error_current = safe_float(health.get("error_rate"), 0.0) * 100
-    if error_current <= 0:
-        error_current = (safe_float(health.get("errors_total"), 0.0) / max(1, asked)) * 100
+    completion_current = view.completion_rate * 100
+    error_current = view.error_rate * 100
 
     if cost_trend:
         cost_trend.append(total_cost)
@@ -967,34 +1186,33 @@ def render_card(
 
     chart_w = 340
     chart_h = 72
-    draw.text((56, 956), f"Completion {completion_current:.0f}%", fill="#22c55e", font=fonts["mono_sm"])
-    draw_sparkline(draw, 56, 977, chart_w, chart_h, comp_trend, "#22c55e")
-
-    draw.text((430, 956), f"Weekly Cost ${total_cost:.2f}", fill="#3b82f6", font=fonts["mono_sm"])
-    draw_sparkline(draw, 430, 977, chart_w, chart_h, cost_trend, "#3b82f6")
-
-    draw.text((804, 956), f"Error Rate {error_current:.1f}%", fill="#dc2626", font=fonts["mono_sm"])
-    draw_sparkline(draw, 804, 977, chart_w, chart_h, err_trend, "#dc2626")
+    for chart_x, chart_label, trend, color in (
+        (56, f"Completion {completion_current:.0f}%", comp_trend, "#22c55e"),
+        (430, f"Weekly Cost ${total_cost:.2f}", cost_trend, "#3b82f6"),
+        (804, f"Error Rate {error_current:.1f}%", err_trend, "#dc2626"),
+    ):
+        cached_text(draw, (chart_x, 956), chart_label, fill=color, font=fonts["mono_sm"])
+        draw_sparkline(draw, chart_x, 977, chart_w, chart_h, trend, color)
 
     if not cost_trend and not comp_trend and not err_trend:
-        draw.text((48, 1028), "Tracking starts next week", fill=TEXT_DIM, font=fonts["mono_sm"])
+        cached_text(draw, (48, 1028), "Tracking starts next week", fill=TEXT_DIM, font=fonts["mono_sm"])
     elif len(cost_trend) > 1:
         delta = cost_trend[-1] - cost_trend[-2] if len(cost_trend) > 1 else 0
         arrow = "↑" if delta > 0 else "↓"
-        draw.text((48, 1028), f"{arrow} from ${abs(delta):.2f} week-over-week", fill=TEXT_DIM, font=fonts["mono_sm"])
+        cached_text(draw, (48, 1028), f"{arrow} from ${abs(delta):.2f} week-over-week", fill=TEXT_DIM, font=fonts["mono_sm"])
     elif len(comp_trend) > 1:
         delta = comp_trend[-1] - comp_trend[-2]
         arrow = "↑" if delta > 0 else "↓"
-        draw.text((48, 1028), f"{arrow} {abs(delta):.1f}pts completion week-over-week", fill=TEXT_DIM, font=fonts["mono_sm"])
+        cached_text(draw, (48, 1028), f"{arrow} {abs(delta):.1f}pts completion week-over-week", fill=TEXT_DIM, font=fonts["mono_sm"])
 
     # Manager's note
     section_well(draw, 1060, 1254)
-    draw.text((48, 1076), "MANAGER'S NOTE", fill=TEXT_BRIGHT, font=fonts["heading"])
-    note = choose_manager_note(analysis, refs_dir / "roasts.json", seed=seed)
-    lines = wrap_lines(draw, note, fonts["body_sm"], WIDTH - 96, max_lines=6)
+    cached_text(draw, (48, 1076), "MANAGER'S NOTE", fill=TEXT_BRIGHT, font=fonts["heading"])
+    note = choose_manager_note(analysis, refs_dir / "roasts.json", seed=seed, values=values, recs=recs)
+    lines = wrap_lines(draw, note, fonts["body_sm"], CONTENT_W, max_lines=6)
     yy = 1114
     for line in lines:
-        draw.text((56, yy), line, fill=TEXT_MED, font=fonts["body_sm"])
+        cached_text(draw, (56, yy), line, fill=TEXT_MED, font=fonts["body_sm"])
         yy += 28
 
     # Improvement plan
@@ -1005,18 +1223,17 @@ def render_card(
     except ValueError:
         next_week_n = 0
     header = f"PERFORMANCE IMPROVEMENT PLAN — WEEK {next_week_n if next_week_n else 'N+1'}"
-    draw.text((48, 1278), header, fill=TEXT_BRIGHT, font=fonts["heading"])
+    cached_text(draw, (48, 1278), header, fill=TEXT_BRIGHT, font=fonts["heading"])
 
-    recs = generate_recommendations(analysis)
     ry = 1316
     for idx, rec in enumerate(recs, start=1):
         category = rec.get("category", "EFFICIENCY")
         cat_color = CATEGORY_COLORS.get(category, "#3b82f6")
         tag = f"[{category}]"
-        draw.text((56, ry), f"{idx}.", fill=TEXT_MED, font=fonts["mono_sm"])
-        draw.text((84, ry), tag, fill=cat_color, font=fonts["mono_sm"])
-        draw.text((174, ry), safe_text(rec.get("text", ""), default="", max_len=120), fill=TEXT_MED, font=fonts["body_xs"])
-        draw.text((174, ry + 19), f"→ {safe_text(rec.get('impact', ''), default='', max_len=120)}", fill=TEXT_DIM, font=fonts["mono_xs"])
+        cached_text(draw, (56, ry), f"{idx}.", fill=TEXT_MED, font=fonts["mono_sm"])
+        cached_text(draw, (84, ry), tag, fill=cat_color, font=fonts["mono_sm"])
+        cached_text(draw, (174, ry), safe_text(rec.get("text", ""), default="", max_len=120), fill=TEXT_MED, font=fonts["body_xs"])
+        cached_text(draw, (174, ry + 19), f"→ {safe_text(rec.get('impact', ''), default='', max_len=120)}", fill=TEXT_DIM, font=fonts["mono_xs"])
         ry += 52
 
     # Rating scale
@@ -1032,45 +1249,46 @@ def render_card(
         draw.rectangle((x1, y1, x2, y2), fill=color)
         if idx == current_tier:
             draw.rectangle((x1 - 2, y1 - 2, x2 + 2, y2 + 2), outline=TEXT_BRIGHT, width=2)
-    draw.text((56, 1509), "Unpaid Intern", fill=TEXT_DIM, font=fonts["mono_xs"])
-    draw.text((WIDTH - 56, 1509), "AGI", fill=TEXT_DIM, font=fonts["mono_xs"], anchor="ra")
+    cached_text(draw, (56, 1509), "Unpaid Intern", fill=TEXT_DIM, font=fonts["mono_xs"])
+    cached_text(draw, (ROW_RIGHT, 1509), "AGI", fill=TEXT_DIM, font=fonts["mono_xs"], anchor="ra")
 
     # Footer
     section_well(draw, 1530, 1582)
-    draw.text((48, 1548), "IS MY AGENT WORKING OR JUST VIBING?", fill=TEXT_MED, font=fonts["heading"])
-    draw.text(
-        (WIDTH - 48, 1548),
+    cached_text(draw, (48, 1548), "IS MY AGENT WORKING OR JUST VIBING?", fill=TEXT_MED, font=fonts["heading"])
+    cached_text(
+        draw,
+        (CONTENT_RIGHT, 1548),
         "github.com/tmishra-sp/agent-performance-review",
         fill=TEXT_DIM,
         font=fonts["mono_sm"],
         anchor="ra",
     )
 
-    crab = assets_dir / "crab.png"
-    if crab.exists():
-        try:
-            crab_img = Image.open(crab).convert("RGBA")
-            crab_img.thumbnail((34, 34))
-            img.alpha_composite(crab_img, (WIDTH - 44, 1538))
-        except OSError:
-            pass
+    try:
+        crab_img = Image.open(assets_dir / "crab.png").convert("RGBA")
+        crab_img.thumbnail((34, 34))
+        img.paste(crab_img, (WIDTH - 44, 1538), crab_img)
+    except OSError:
+        pass
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    rgb = img.convert("RGB")
-    rgb.save(out_path, format="PNG", optimize=True, compress_level=9)
+    if png8:
+        img = img.quantize(colors=256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+    img.save(out_path, format="PNG", compress_level=6)
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate the Agent Performance Review card PNG")
     parser.add_argument("analysis_json", type=Path)
     parser.add_argument("output_png", type=Path)
     parser.add_argument("--fonts-dir", type=Path, default=Path("card-template/fonts"))
     parser.add_argument("--seed", type=int, default=None, help="Deterministic seed for roast/template choices")
-    return parser.parse_args()
+    parser.add_argument("--png8", action="store_true", help="Write a 256-colour palette PNG (smaller file, faster encode)")
+    return parser.parse_args(argv)
 
 
-def main() -> None:
-    args = parse_args()
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
     analysis = normalize_analysis(load_json(args.analysis_json))
 
     script_dir = Path(__file__).resolve().parent
@@ -1093,18 +1311,24 @@ def main() -> None:
         assets_dir=assets_dir,
         refs_dir=refs_dir,
         seed=args.seed,
+        png8=args.png8,
     )
 
 
-if __name__ == "__main__":
+def cli(argv: Optional[Sequence[str]] = None) -> int:
     try:
-        main()
+        main(argv)
     except CardGenerationError as exc:
         print(f"Error: {exc}", file=sys.stderr)
-        raise SystemExit(1) from exc
+        return 1
     except KeyboardInterrupt:
         print("Error: card generation interrupted by user.", file=sys.stderr)
-        raise SystemExit(130)
+        return 130
     except Exception as exc:  # pragma: no cover - defensive catch-all for CLI UX
         print(f"Error: unexpected failure while generating card: {exc}", file=sys.stderr)
-        raise SystemExit(1) from exc
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(cli())
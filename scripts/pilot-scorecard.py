@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Generate a pilot impact scorecard from two analysis JSON snapshots."""
+"""Generate a pilot impact scorecard from baseline and current analysis JSON snapshots."""
 
 from __future__ import annotations
 
@@ -9,7 +9,12 @@ import math
 import sys
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 
 class ScorecardError(Exception):
@@ -42,11 +47,10 @@ def normalize_pct(value: object) -> float:
 
 
 def load_json(path: Path) -> Dict:
-    if not path.exists():
-        raise ScorecardError(f"analysis file does not exist: {path}")
     try:
-        with path.open("r", encoding="utf-8") as f:
-            payload = json.load(f)
+        payload = json_loads(path.read_bytes())
+    except FileNotFoundError as exc:
+        raise ScorecardError(f"analysis file does not exist: {path}") from exc
     except json.JSONDecodeError as exc:
         raise ScorecardError(f"analysis file is not valid JSON: {path} ({exc})") from exc
     except OSError as exc:
@@ -154,18 +158,18 @@ def summarize(rows: List[MetricRow]) -> Dict[str, object]:
     }
 
 
+# Unknown units render as pct.
+VALUE_FORMATS = {"usd": "${:,.2f}".format, "pct": "{:.1f}%".format}
+DELTA_FORMATS = {"usd": "{}${:,.2f}".format, "pct": "{}{:.1f}pp".format}
+
+
 def fmt_value(value: float, unit: str) -> str:
-    if unit == "usd":
-        return f"${value:,.2f}"
-    return f"{value:.1f}%"
+    return VALUE_FORMATS.get(unit, VALUE_FORMATS["pct"])(value)
 
 
 def fmt_delta(value: float, unit: str) -> str:
     sign = "+" if value >= 0 else "-"
-    abs_v = abs(value)
-    if unit == "usd":
-        return f"{sign}${abs_v:,.2f}"
-    return f"{sign}{abs_v:.1f}pp"
+    return DELTA_FORMATS.get(unit, DELTA_FORMATS["pct"])(sign, abs(value))
 
 
 def fmt_delta_pct(value: Optional[float]) -> str:
@@ -199,40 +203,58 @@ def to_markdown(payload: Dict[str, object]) -> str:
         unit = str(row.get("unit", "pct"))
         status = "improved" if row.get("improved") else "not improved"
         lines.append(
-            "| "
-            f"{row.get('label', 'Metric')} | "
-            f"{fmt_value(safe_float(row.get('baseline')), unit)} | "
-            f"{fmt_value(safe_float(row.get('current')), unit)} | "
-            f"{fmt_delta(safe_float(row.get('delta')), unit)} | "
-            f"{fmt_delta_pct(row.get('delta_pct'))} | "
-            f"{row.get('direction', 'n/a')} | "
-            f"{status} |"
+            f"| {row.get('label', 'Metric')}"
+            f" | {fmt_value(safe_float(row.get('baseline')), unit)}"
+            f" | {fmt_value(safe_float(row.get('current')), unit)}"
+            f" | {fmt_delta(safe_float(row.get('delta')), unit)}"
+            f" | {fmt_delta_pct(row.get('delta_pct'))}"
+            f" | {row.get('direction', 'n/a')} | {status} |"
         )
     lines.append("")
     return "\n".join(lines)
 
 
 def build_payload(baseline_path: Path, current_path: Path) -> Dict[str, object]:
-    baseline_data = load_json(baseline_path)
-    current_data = load_json(current_path)
-
-    baseline_metrics = extract_metrics(baseline_data)
-    current_metrics = extract_metrics(current_data)
-    rows = build_rows(baseline_metrics, current_metrics)
-    summary = summarize(rows)
-
-    return {
-        "baseline": {"path": str(baseline_path), "period": period_label(baseline_data)},
-        "current": {"path": str(current_path), "period": period_label(current_data)},
-        "summary": summary,
-        "metrics": [asdict(row) for row in rows],
-    }
+    return build_payload_batch([(baseline_path, current_path)])[0]
+
+
+def build_payload_batch(pairs: Sequence[Tuple[Path, Path]]) -> List[Dict[str, object]]:
+    """Build one payload per (baseline, current) pair."""
+    snapshots: Dict[Path, Tuple[Dict[str, str], Dict[str, float]]] = {}
+
+    def snapshot(path: Path) -> Tuple[Dict[str, str], Dict[str, float]]:
+        cached = snapshots.get(path)
+        if cached is None:
+            data = load_json(path)
+            cached = ({"path": str(path), "period": period_label(data)}, extract_metrics(data))
+            snapshots[path] = cached
+        return cached
+
+    payloads: List[Dict[str, object]] = []
+    for baseline_path, current_path in pairs:
+        baseline_info, baseline_metrics = snapshot(baseline_path)
+        current_info, current_metrics = snapshot(current_path)
+        rows = build_rows(baseline_metrics, current_metrics)
+        payloads.append(
+            {
+                "baseline": dict(baseline_info),
+                "current": dict(current_info),
+                "summary": summarize(rows),
+                "metrics": [asdict(row) for row in rows],
+            }
+        )
+    return payloads
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate a pilot before/after impact scorecard.")
     parser.add_argument("baseline_json", type=Path, help="Baseline analysis JSON file")
-    parser.add_argument("current_json", type=Path, help="Current analysis JSON file")
+    parser.add_argument(
+        "current_json",
+        type=Path,
+        nargs="+",
+        help="Current analysis JSON file (several with --batch)",
+    )
     parser.add_argument(
         "--format",
         choices=("markdown", "json"),
@@ -240,16 +262,25 @@ def parse_args() -> argparse.Namespace:
         help="Output format (default: markdown)",
     )
     parser.add_argument("--output", type=Path, default=None, help="Write output to file instead of stdout")
-    return parser.parse_args()
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Score each current file against the baseline; JSON output is always a list",
+    )
+    args = parser.parse_args()
+    if len(args.current_json) > 1 and not args.batch:
+        parser.error("several current analysis files require --batch")
+    return args
 
 
 def main() -> None:
     args = parse_args()
-    payload = build_payload(args.baseline_json, args.current_json)
+    payloads = build_payload_batch([(args.baseline_json, current) for current in args.current_json])
     if args.format == "json":
+        payload = payloads if args.batch else payloads[0]
         text = json.dumps(payload, indent=2, ensure_ascii=False) + "\n"
     else:
-        text = to_markdown(payload)
+        text = "\n".join(to_markdown(payload) for payload in payloads)
 
     if args.output is None:
         sys.stdout.write(text)
@@ -3,38 +3,91 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import functools
 import json
+import os
 import random
-import shutil
 import subprocess
 import tempfile
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+try:
+    from orjson import OPT_APPEND_NEWLINE as _OPT_APPEND_NEWLINE
+    from orjson import dumps as _orjson_dumps
+
+    def json_bytes(obj: object) -> bytes:
+        return _orjson_dumps(obj)
+
+    def json_line(obj: object) -> bytes:
+        return _orjson_dumps(obj, option=_OPT_APPEND_NEWLINE)
+
+except ImportError:
+
+    def json_bytes(obj: object) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def json_line(obj: object) -> bytes:
+        return (json.dumps(obj, separators=(",", ":")) + "\n").encode("utf-8")
+
+
 ROOT = Path(__file__).resolve().parents[1]
 ANALYZER = ROOT / "scripts" / "analyze.sh"
+# Session fixtures go to tmpfs when /dev/shm is writable.
+SCRATCH_ROOT = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+
+_TS_BASE = datetime(2026, 2, 1, 0, 0, 0, tzinfo=timezone.utc)
+_TS_DAYS = tuple((_TS_BASE + timedelta(days=day)).strftime("%Y-%m-%dT") for day in range(21))
+
+_TOOLS = ("read", "write", "edit", "apply_patch", "browser", "unknown_tool")
+_MODELS = (
+    "anthropic/claude-opus-4-6",
+    "anthropic/claude-sonnet-4-5",
+    "anthropic/claude-haiku-4-5",
+    "openai/gpt-4.1",
+    "",
+)
+_ROLES = ("user", "assistant", "toolResult")
+_TEXTS = ("fix bug", "heartbeat", "review", "status", "done")
+_PATHS = ("src/a.ts", "package.json", "/tmp/test.txt", "README.md")
+_RECORD_PROTO = {"type": "message", "timestamp": None, "message": None}
+
+_HEAVY_HEARTBEAT_BYTES = (
+    b"\n".join(
+        json_bytes(
+            {
+                "type": "message",
+                "timestamp": f"2026-02-14T03:{i%60:02d}:00Z",
+                "message": {
+                    "role": "assistant",
+                    "content": [
+                        {"type": "text", "text": "heartbeat"},
+                        {"type": "toolCall", "name": "read", "arguments": {"path": "/tmp/x"}},
+                    ],
+                },
+            }
+        )
+        for i in range(40)
+    )
+    + b"\n"
+)
 
 
 def rand_ts(rng: random.Random) -> str:
-    base = datetime(2026, 2, 1, 0, 0, 0, tzinfo=timezone.utc)
-    dt = base + timedelta(seconds=rng.randint(0, 20 * 24 * 3600))
-    return dt.isoformat().replace("+00:00", "Z")
+    day, rem = divmod(rng.randint(0, 20 * 24 * 3600), 24 * 3600)
+    hour, rem = divmod(rem, 3600)
+    minute, second = divmod(rem, 60)
+    return f"{_TS_DAYS[day]}{hour:02d}:{minute:02d}:{second:02d}Z"
 
 
 def random_tool(rng: random.Random) -> str:
-    return rng.choice(["read", "write", "edit", "apply_patch", "browser", "unknown_tool"])
+    return rng.choice(_TOOLS)
 
 
 def random_model(rng: random.Random) -> str:
-    return rng.choice(
-        [
-            "anthropic/claude-opus-4-6",
-            "anthropic/claude-sonnet-4-5",
-            "anthropic/claude-haiku-4-5",
-            "openai/gpt-4.1",
-            "",
-        ]
-    )
+    return rng.choice(_MODELS)
 
 
 def maybe_cost(rng: random.Random):
@@ -43,26 +96,30 @@ def maybe_cost(rng: random.Random):
     return round(rng.uniform(0.001, 0.08), 4)
 
 
-def make_record(rng: random.Random) -> str:
+def make_record(rng: random.Random) -> bytes:
+    """Return one JSONL line, trailing newline included."""
+    rand = rng.random
+    choice = rng.choice
+
     # Intentionally produce a blend of valid and invalid lines.
-    if rng.random() < 0.16:
-        return "{ this is malformed json"
-    if rng.random() < 0.1:
-        return ""
+    if rand() < 0.16:
+        return b"{ this is malformed json\n"
+    if rand() < 0.1:
+        return b"\n"
 
-    role = rng.choice(["user", "assistant", "toolResult"])
+    role = choice(_ROLES)
     content = []
 
-    if rng.random() < 0.8:
-        content.append({"type": "text", "text": rng.choice(["fix bug", "heartbeat", "review", "status", "done"])})
+    if rand() < 0.8:
+        content.append({"type": "text", "text": choice(_TEXTS)})
 
-    if role != "user" and rng.random() < 0.7:
+    if role != "user" and rand() < 0.7:
         content.append(
             {
                 "type": "toolCall",
                 "id": f"tc-{rng.randint(1, 9999)}",
                 "name": random_tool(rng),
-                "arguments": {"path": rng.choice(["src/a.ts", "package.json", "/tmp/test.txt", "README.md"])},
+                "arguments": {"path": choice(_PATHS)},
             }
         )
 
@@ -71,7 +128,7 @@ def make_record(rng: random.Random) -> str:
         "content": content,
     }
 
-    if role == "assistant" and rng.random() < 0.2:
+    if role == "assistant" and rand() < 0.2:
         msg["stopReason"] = "error"
 
     model = random_model(rng)
@@ -83,35 +140,75 @@ def make_record(rng: random.Random) -> str:
         msg["usage"] = {"cost": {"total": cost}}
 
     # Randomly place timestamp/message fields in old/new style.
-    if rng.random() < 0.15:
+    if rand() < 0.15:
         record = {"type": "message", "message": msg}
-        if rng.random() < 0.4:
+        if rand() < 0.4:
             record["timestamp"] = rand_ts(rng)
     else:
-        record = {"type": "message", "timestamp": rand_ts(rng), "message": msg}
+        record = _RECORD_PROTO.copy()
+        record["timestamp"] = rand_ts(rng)
+        record["message"] = msg
 
-    if role == "toolResult" and rng.random() < 0.25:
+    if role == "toolResult" and rand() < 0.25:
         record["message"]["content"].append({"type": "text", "text": '{"isError":true}'})
 
-    return json.dumps(record)
+    return json_line(record)
 
 
-def run_once(seed: int) -> None:
-    rng = random.Random(seed)
-    temp_dir = Path(tempfile.mkdtemp(prefix="apr-fuzz-analyze-"))
+def write_file(path: Path, payload: bytes) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
     try:
-        sessions_dir = temp_dir / "sessions"
-        sessions_dir.mkdir(parents=True, exist_ok=True)
-
-        session_files = rng.randint(1, 5)
-        for idx in range(session_files):
-            name = rng.choice([f"session-{idx}", f"heartbeat-{idx}", f"cron-{idx}"])
-            path = sessions_dir / f"{name}.jsonl"
-            line_count = rng.randint(1, 60)
-            lines = [make_record(rng) for _ in range(line_count)]
-            path.write_text("\n".join(lines) + "\n", encoding="utf-8")
-
-        cmd = [
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+
+def run_once(seed: int, work_dir: str) -> None:
+    rng = random.Random(seed)
+    sessions_dir = Path(work_dir, f"seed-{seed}", "sessions")
+    sessions_dir.mkdir(parents=True, exist_ok=True)
+
+    session_files = rng.randint(1, 5)
+    for idx in range(session_files):
+        name = rng.choice([f"session-{idx}", f"heartbeat-{idx}", f"cron-{idx}"])
+        path = sessions_dir / f"{name}.jsonl"
+        line_count = rng.randint(1, 60)
+        write_file(path, b"".join([make_record(rng) for _ in range(line_count)]))
+
+    cmd = [
+        str(ANALYZER),
+        str(sessions_dir),
+        "--since",
+        "2026-02-01",
+        "--until",
+        "2026-02-28",
+        "--max-records",
+        "10000",
+    ]
+    proc = subprocess.run(cmd, capture_output=True)
+
+    if proc.returncode == 0:
+        data = json.loads(proc.stdout)
+        for key in ["meta", "cost", "tasks", "autonomous", "skills", "health", "rating"]:
+            assert key in data, f"missing key '{key}'"
+        ingest = data.get("meta", {}).get("ingestion", {})
+        assert isinstance(ingest, dict), "meta.ingestion must be object"
+        selected = ingest.get("selected_records", 0)
+        assert isinstance(selected, int), "meta.ingestion.selected_records must be integer"
+        assert selected <= 10000, "selected_records exceeded max-records"
+    else:
+        err = proc.stderr.strip()
+        assert err.startswith(b"Error:"), f"non-structured analyzer error: {err!r}"
+
+
+def check_max_records_guard(work_dir: Path) -> None:
+    # Explicit max-record guard check with deterministic heavy input.
+    sessions_dir = work_dir / "guard" / "sessions"
+    sessions_dir.mkdir(parents=True)
+    write_file(sessions_dir / "heavy-heartbeat.jsonl", _HEAVY_HEARTBEAT_BYTES)
+
+    guard = subprocess.run(
+        [
             str(ANALYZER),
             str(sessions_dir),
             "--since",
@@ -119,67 +216,19 @@ def run_once(seed: int) -> None:
             "--until",
             "2026-02-28",
             "--max-records",
-            "10000",
-        ]
-        proc = subprocess.run(cmd, capture_output=True, text=True)
-
-        if proc.returncode == 0:
-            data = json.loads(proc.stdout)
-            for key in ["meta", "cost", "tasks", "autonomous", "skills", "health", "rating"]:
-                assert key in data, f"missing key '{key}'"
-            ingest = data.get("meta", {}).get("ingestion", {})
-            assert isinstance(ingest, dict), "meta.ingestion must be object"
-            selected = ingest.get("selected_records", 0)
-            assert isinstance(selected, int), "meta.ingestion.selected_records must be integer"
-            assert selected <= 10000, "selected_records exceeded max-records"
-        else:
-            err = (proc.stderr or "").strip()
-            assert err.startswith("Error:"), f"non-structured analyzer error: {err!r}"
-
-        # Explicit max-record guard check with deterministic heavy input.
-        heavy = sessions_dir / "heavy-heartbeat.jsonl"
-        heavy_lines = []
-        for i in range(40):
-            heavy_lines.append(
-                json.dumps(
-                    {
-                        "type": "message",
-                        "timestamp": f"2026-02-14T03:{i%60:02d}:00Z",
-                        "message": {
-                            "role": "assistant",
-                            "content": [
-                                {"type": "text", "text": "heartbeat"},
-                                {"type": "toolCall", "name": "read", "arguments": {"path": "/tmp/x"}},
-                            ],
-                        },
-                    }
-                )
-            )
-        heavy.write_text("\n".join(heavy_lines) + "\n", encoding="utf-8")
-
-        guard = subprocess.run(
-            [
-                str(ANALYZER),
-                str(sessions_dir),
-                "--since",
-                "2026-02-01",
-                "--until",
-                "2026-02-28",
-                "--max-records",
-                "1",
-            ],
-            capture_output=True,
-            text=True,
-        )
-        assert guard.returncode != 0, "expected max-record guard failure"
-        assert "exceeds --max-records" in (guard.stderr or ""), f"unexpected max-record error: {guard.stderr!r}"
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+            "1",
+        ],
+        capture_output=True,
+    )
+    assert guard.returncode != 0, "expected max-record guard failure"
+    assert b"exceeds --max-records" in guard.stderr, f"unexpected max-record error: {guard.stderr!r}"
 
 
 def main() -> None:
-    for seed in range(40):
-        run_once(10_000 + seed)
+    with tempfile.TemporaryDirectory(prefix="apr-fuzz-analyze-", dir=SCRATCH_ROOT, ignore_cleanup_errors=True) as scratch:
+        with concurrent.futures.ProcessPoolExecutor() as pool:
+            list(pool.map(functools.partial(run_once, work_dir=scratch), range(10_000, 10_040), chunksize=4))
+        check_max_records_guard(Path(scratch))
     print("fuzz_analyze: ok")
 
 
@@ -3,16 +3,50 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
+import functools
+import importlib.util
+import io
 import json
+import os
 import random
-import shutil
-import subprocess
 import tempfile
 from pathlib import Path
+from types import ModuleType
+from typing import List, Tuple
 
 ROOT = Path(__file__).resolve().parents[1]
 CARD = ROOT / "scripts" / "generate-card.py"
 FONTS = ROOT / "card-template" / "fonts"
+# Seed files live on tmpfs when it is available.
+SCRATCH_ROOT = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+_TITLES = ("Unpaid Intern", "Quiet Quitter", "Ships Code", "Founder Mode", "AGI")
+_PREVIOUS_TITLES = _TITLES[:3]
+_COLORS = ("#dc2626", "#f97316", "#22c55e", "#3b82f6", "#a855f7")
+
+
+@functools.lru_cache(maxsize=None)
+def card_module() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("generate_card", CARD)
+    assert spec is not None and spec.loader is not None, f"cannot load {CARD}"
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _warm() -> None:
+    module = card_module()
+    for filename, size in module.FONT_SPECS.values():
+        module.safe_font(FONTS / filename, size)
+
+
+def run_card(argv: List[str]) -> Tuple[int, str]:
+    err = io.StringIO()
+    with contextlib.redirect_stderr(err):
+        code = card_module().cli(argv)
+    return code, err.getvalue()
 
 
 def random_value(rng: random.Random):
@@ -32,125 +66,121 @@ def random_value(rng: random.Random):
 
 def random_analysis(rng: random.Random) -> dict:
     # Intentionally irregular structure to stress normalization and fallback paths.
+    randint = rng.randint
+    rand = rng.random
+    choice = rng.choice
     data = {
-        "meta": {"period": {"start": "2026-02-10", "end": "2026-02-16", "days": rng.randint(0, 10)}, "agent_id": "main"},
+        "meta": {"period": {"start": "2026-02-10", "end": "2026-02-16", "days": randint(0, 10)}, "agent_id": "main"},
         "tasks": {
-            "asked": rng.randint(0, 50),
-            "completed": rng.randint(0, 50),
-            "failed": rng.randint(0, 20),
-            "in_progress": rng.randint(0, 10),
-            "completion_rate": rng.random(),
+            "asked": randint(0, 50),
+            "completed": randint(0, 50),
+            "failed": randint(0, 20),
+            "in_progress": randint(0, 10),
+            "completion_rate": rand(),
             "highlights": [],
         },
         "cost": {
-            "total_usd": round(rng.random() * 40, 2),
-            "per_completed_task_usd": round(rng.random() * 5, 2),
+            "total_usd": round(rand() * 40, 2),
+            "per_completed_task_usd": round(rand() * 5, 2),
             "by_source": {
-                "user_requests": {"usd": round(rng.random() * 10, 2), "pct": rng.randint(0, 100), "count": rng.randint(0, 200)},
-                "heartbeats": {"usd": round(rng.random() * 10, 2), "pct": rng.randint(0, 100), "count": rng.randint(0, 200)},
-                "cron_jobs": {"usd": round(rng.random() * 10, 2), "pct": rng.randint(0, 100), "count": rng.randint(0, 200)},
-                "self_initiated": {"usd": round(rng.random() * 10, 2), "pct": rng.randint(0, 100), "count": rng.randint(0, 200)},
+                "user_requests": {"usd": round(rand() * 10, 2), "pct": randint(0, 100), "count": randint(0, 200)},
+                "heartbeats": {"usd": round(rand() * 10, 2), "pct": randint(0, 100), "count": randint(0, 200)},
+                "cron_jobs": {"usd": round(rand() * 10, 2), "pct": randint(0, 100), "count": randint(0, 200)},
+                "self_initiated": {"usd": round(rand() * 10, 2), "pct": randint(0, 100), "count": randint(0, 200)},
             },
             "trend": [],
         },
         "autonomous": {
-            "total_actions": rng.randint(0, 400),
-            "useful_count": rng.randint(0, 120),
-            "useful_rate": rng.random(),
+            "total_actions": randint(0, 400),
+            "useful_count": randint(0, 120),
+            "useful_rate": rand(),
             "notable": [],
-            "three_am_sessions": rng.randint(0, 10),
-            "three_am_useful": rng.randint(0, 5),
+            "three_am_sessions": randint(0, 10),
+            "three_am_useful": randint(0, 5),
         },
         "skills": {
-            "installed": rng.randint(0, 20),
-            "used": rng.randint(0, 20),
+            "installed": randint(0, 20),
+            "used": randint(0, 20),
             "top_used": [],
-            "unused": ["skill-a", "skill-b"] if rng.random() < 0.5 else [],
+            "unused": ["skill-a", "skill-b"] if rand() < 0.5 else [],
         },
         "health": {
-            "errors_total": rng.randint(0, 100),
-            "errors_self_caused": rng.randint(0, 40),
-            "tool_failures": rng.randint(0, 60),
-            "context_overflows": rng.randint(0, 8),
-            "compactions": rng.randint(0, 20),
-            "avg_response_seconds": round(rng.random() * 35, 2),
-            "read_write_ratio": rng.randint(0, 500),
-            "error_rate": rng.random(),
+            "errors_total": randint(0, 100),
+            "errors_self_caused": randint(0, 40),
+            "tool_failures": randint(0, 60),
+            "context_overflows": randint(0, 8),
+            "compactions": randint(0, 20),
+            "avg_response_seconds": round(rand() * 35, 2),
+            "read_write_ratio": randint(0, 500),
+            "error_rate": rand(),
             "error_rate_trend": [],
         },
         "rating": {
-            "title": rng.choice(["Unpaid Intern", "Quiet Quitter", "Ships Code", "Founder Mode", "AGI"]),
-            "color": rng.choice(["#dc2626", "#f97316", "#22c55e", "#3b82f6", "#a855f7"]),
-            "tier_index": rng.randint(0, 5),
-            "task_completion_rate": rng.random(),
-            "percentile": rng.randint(1, 99),
-            "previous_title": rng.choice(["Unpaid Intern", "Quiet Quitter", "Ships Code"]),
-            "improved": rng.choice([True, False]),
+            "title": choice(_TITLES),
+            "color": choice(_COLORS),
+            "tier_index": randint(0, 5),
+            "task_completion_rate": rand(),
+            "percentile": randint(1, 99),
+            "previous_title": choice(_PREVIOUS_TITLES),
+            "improved": choice((True, False)),
         },
     }
 
-    for _ in range(rng.randint(5, 18)):
-        section = rng.choice(list(data.keys()))
-        if isinstance(data[section], dict) and data[section]:
-            key = rng.choice(list(data[section].keys()))
+    sections = tuple(data)
+    section_keys = {section: tuple(sub) for section, sub in data.items() if isinstance(sub, dict)}
+    for _ in range(randint(5, 18)):
+        section = choice(sections)
+        keys = section_keys.get(section)
+        if keys:
+            key = choice(keys)
             data[section][key] = random_value(rng)
 
     return data
 
 
-def run_one(seed: int) -> None:
+def run_one(seed: int, work_dir: str) -> None:
     rng = random.Random(seed)
-    temp_dir = Path(tempfile.mkdtemp(prefix="apr-fuzz-card-"))
-    try:
-        analysis_file = temp_dir / "analysis.json"
-        out_png = temp_dir / "out.png"
-        analysis_file.write_text(json.dumps(random_analysis(rng)), encoding="utf-8")
-
-        proc = subprocess.run(
-            [
-                "python3",
-                str(CARD),
-                str(analysis_file),
-                str(out_png),
-                "--fonts-dir",
-                str(FONTS),
-                "--seed",
-                "7",
-            ],
-            capture_output=True,
-            text=True,
-        )
-
-        if proc.returncode == 0:
-            assert out_png.exists(), "card output missing after successful run"
-        else:
-            err = proc.stderr or ""
-            assert "Traceback" not in err, f"unexpected traceback in card failure: {err}"
-            assert "Error:" in err, f"expected structured error output, got: {err!r}"
-
-        bad_fonts = subprocess.run(
-            [
-                "python3",
-                str(CARD),
-                str(analysis_file),
-                str(out_png),
-                "--fonts-dir",
-                str(temp_dir / "missing-fonts"),
-                "--seed",
-                "7",
-            ],
-            capture_output=True,
-            text=True,
-        )
-        assert bad_fonts.returncode != 0, "expected missing fonts dir failure"
-        assert "fonts directory does not exist" in (bad_fonts.stderr or ""), bad_fonts.stderr
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    temp_dir = Path(work_dir, f"seed-{seed}")
+    temp_dir.mkdir()
+    analysis_file = temp_dir / "analysis.json"
+    out_png = temp_dir / "out.png"
+    analysis_file.write_text(json.dumps(random_analysis(rng)), encoding="utf-8")
+
+    code, err = run_card(
+        [
+            str(analysis_file),
+            str(out_png),
+            "--fonts-dir",
+            str(FONTS),
+            "--seed",
+            "7",
+        ]
+    )
+
+    if code == 0:
+        assert out_png.exists(), "card output missing after successful run"
+    else:
+        assert "Traceback" not in err, f"unexpected traceback in card failure: {err}"
+        assert "Error:" in err, f"expected structured error output, got: {err!r}"
+
+    bad_code, bad_err = run_card(
+        [
+            str(analysis_file),
+            str(out_png),
+            "--fonts-dir",
+            str(temp_dir / "missing-fonts"),
+            "--seed",
+            "7",
+        ]
+    )
+    assert bad_code != 0, "expected missing fonts dir failure"
+    assert "fonts directory does not exist" in bad_err, bad_err
 
 
 def main() -> None:
-    for seed in range(30):
-        run_one(20_000 + seed)
+    with tempfile.TemporaryDirectory(prefix="apr-fuzz-card-", dir=SCRATCH_ROOT, ignore_cleanup_errors=True) as scratch:
+        with concurrent.futures.ProcessPoolExecutor(initializer=_warm) as pool:
+            list(pool.map(functools.partial(run_one, work_dir=scratch), range(20_000, 20_030), chunksize=4))
     print("fuzz_card: ok")
 
 
@@ -12,14 +12,17 @@ FIXTURE_CONFIG="$ROOT/tests/fixtures/openclaw.json"
 MINIMAL_ANALYSIS="$ROOT/tests/fixtures/minimal-analysis.json"
 BASELINE_ANALYSIS="$ROOT/tests/fixtures/baseline-analysis.json"
 CURRENT_ANALYSIS="$ROOT/tests/fixtures/current-analysis.json"
+LITERAL_SAVINGS_RECS="$ROOT/tests/fixtures/literal-savings-recommendations.json"
 OUT_JSON="$(mktemp)"
 OUT_PNG="$(mktemp /tmp/apr-card.XXXXXX).png"
 OUT_PNG_MIN="$(mktemp /tmp/apr-card-min.XXXXXX).png"
+OUT_PNG8="$(mktemp /tmp/apr-card-png8.XXXXXX).png"
 OUT_SCORE_JSON="$(mktemp)"
 OUT_SCORE_MD="$(mktemp)"
 INVALID_ANALYSIS="$(mktemp)"
 ERR_LOG="$(mktemp)"
-trap 'rm -f "$OUT_JSON" "$OUT_PNG" "$OUT_PNG_MIN" "$OUT_SCORE_JSON" "$OUT_SCORE_MD" "$INVALID_ANALYSIS" "$ERR_LOG"' EXIT
+REC_TREE="$(mktemp -d)"
+trap 'rm -f "$OUT_JSON" "$OUT_PNG" "$OUT_PNG_MIN" "$OUT_PNG8" "$OUT_SCORE_JSON" "$OUT_SCORE_MD" "$INVALID_ANALYSIS" "$ERR_LOG"; rm -rf "$REC_TREE"' EXIT
 
 bash -n "$ANALYZER"
 python3 -m py_compile "$CARD"
@@ -56,6 +59,17 @@ img = Image.open(sys.argv[1])
 assert img.size == (1200, 1800), img.size
 PY
 
+python3 "$CARD" "$ROOT/examples/sample-analysis.json" "$OUT_PNG8" --fonts-dir "$ROOT/card-template/fonts" --seed 7 --png8
+python3 - "$OUT_PNG8" "$OUT_PNG" <<'PY'
+import os
+import sys
+from PIL import Image
+img = Image.open(sys.argv[1])
+assert img.size == (1200, 1800), img.size
+assert img.mode == "P", img.mode
+assert os.path.getsize(sys.argv[1]) < os.path.getsize(sys.argv[2]), "palette card is not smaller than the RGB card"
+PY
+
 python3 "$CARD" "$MINIMAL_ANALYSIS" "$OUT_PNG_MIN" --fonts-dir "$ROOT/card-template/fonts" --seed 7
 python3 - "$OUT_PNG_MIN" <<'PY'
 import sys
@@ -64,6 +78,52 @@ img = Image.open(sys.argv[1])
 assert img.size == (1200, 1800), img.size
 PY
 
+# A pattern whose impact names a literal dollar figure (no ${placeholder}) still
+# yields that figure as the tip's savings.
+mkdir -p "$REC_TREE/scripts" "$REC_TREE/references"
+cp "$CARD" "$REC_TREE/scripts/generate-card.py"
+cp "$LITERAL_SAVINGS_RECS" "$REC_TREE/references/recommendations.json"
+python3 - "$REC_TREE/scripts/generate-card.py" "$ROOT/examples/sample-analysis.json" <<'PY'
+import importlib.util
+import json
+import sys
+spec = importlib.util.spec_from_file_location("generate_card", sys.argv[1])
+card = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(card)
+with open(sys.argv[2], encoding="utf-8") as fh:
+    analysis = json.load(fh)
+text, savings = card.choose_tip(analysis)
+assert text == "Move heartbeats to a cheaper model", text
+assert savings == 12.0, savings
+PY
+
+# Recommendation conditions: a keyword doubled up makes the clause after it invalid.
+python3 - "$CARD" <<'PY'
+import importlib.util
+import sys
+spec = importlib.util.spec_from_file_location("generate_card", sys.argv[1])
+card = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(card)
+metrics = {"x": 0.0, "y": 2.0, "z": 5.0}
+cases = {
+    "y > 1": True,
+    "x > 1 OR y > 1": True,
+    "y > 1 AND z >= 5": True,
+    "y > 1 AND z > 5": False,
+    "x OR OR y > 1": False,
+    "x > 1 OR OR y > 1": False,
+    "y > 1 OR OR x > 1": True,
+    "x > 1 OR OR OR y > 1": True,
+    "y > 1 AND AND z > 1": False,
+    "y > 1 AND OR z > 1": True,
+    "y > 1 OR": False,
+    "OR y > 1": False,
+}
+for condition, expected in cases.items():
+    got = card.compile_condition(condition)(metrics)
+    assert got is expected, (condition, got)
+PY
+
 printf '{\"bad_json\": \n' > "$INVALID_ANALYSIS"
 if python3 "$CARD" "$INVALID_ANALYSIS" "$OUT_PNG_MIN" --fonts-dir "$ROOT/card-template/fonts" --seed 7 > /dev/null 2>"$ERR_LOG"; then
   echo "Expected invalid JSON card generation to fail, but it succeeded." >&2
@@ -86,7 +146,38 @@ if ! grep -q "Pilot Impact Scorecard" "$OUT_SCORE_MD"; then
   exit 1
 fi
 
-python3 "$FUZZ_ANALYZE"
+python3 "$SCORECARD" "$BASELINE_ANALYSIS" "$CURRENT_ANALYSIS" "$BASELINE_ANALYSIS" --batch --format json --output "$OUT_SCORE_JSON"
+jq -e 'length == 2 and .[0].summary.score == 100 and .[1].summary.score == 0' "$OUT_SCORE_JSON" >/dev/null
+jq -e '.[0].current.path != .[1].current.path and .[0].baseline == .[1].baseline' "$OUT_SCORE_JSON" >/dev/null
+
+python3 "$SCORECARD" "$BASELINE_ANALYSIS" "$CURRENT_ANALYSIS" --batch --format json --output "$OUT_SCORE_JSON"
+jq -e 'type == "array" and length == 1 and .[0].summary.score == 100' "$OUT_SCORE_JSON" >/dev/null
+
+python3 "$SCORECARD" "$BASELINE_ANALYSIS" "$CURRENT_ANALYSIS" "$BASELINE_ANALYSIS" --batch --format markdown --output "$OUT_SCORE_MD"
+if [[ "$(grep -c "Pilot Impact Scorecard" "$OUT_SCORE_MD")" != 2 ]]; then
+  echo "Expected one markdown scorecard per current window." >&2
+  exit 1
+fi
+
+if python3 "$SCORECARD" "$BASELINE_ANALYSIS" "$CURRENT_ANALYSIS" "$BASELINE_ANALYSIS" --format json > /dev/null 2>"$ERR_LOG"; then
+  echo "Expected several current files without --batch to fail, but it succeeded." >&2
+  exit 1
+fi
+if ! grep -q "require --batch" "$ERR_LOG"; then
+  echo "Expected --batch usage error, got:" >&2
+  cat "$ERR_LOG" >&2
+  exit 1
+fi
+
+# The analyzer fuzzer is stdlib-only, so it can run under PyPy (3.10+) when installed;
+# set FUZZ_PYTHON to pick an interpreter explicitly.
+if [[ -z "${FUZZ_PYTHON:-}" ]]; then
+  FUZZ_PYTHON=python3
+  if command -v pypy3 >/dev/null 2>&1 && pypy3 -c 'import sys; raise SystemExit(sys.version_info < (3, 10))' 2>/dev/null; then
+    FUZZ_PYTHON=pypy3
+  fi
+fi
+"$FUZZ_PYTHON" "$FUZZ_ANALYZE"
 python3 "$FUZZ_CARD"
 
 echo "All tests passed."